@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-import copy
+import hashlib
+import re
+from types import MappingProxyType
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 
 from src.models import (
     RawWorkbook, StandardizedFinancials, MappingReport,
-    DCFAssumptions, DCFResult,
+    DCFAssumptions, DCFResult, DRIVER_FIELDS,
 )
 from src.importer import parse_workbook
 from src.mapping import build_standardized
@@ -19,8 +22,8 @@ from src.charts import (
     pv_cash_flows_chart, explicit_vs_terminal_pie, tornado_chart,
     sensitivity_heatmap, reinvestment_vs_growth,
 )
-from src.explain import get_explanation, all_keys, EXPLANATIONS
-from src.utils import fmt_number, fmt_pct, fmt_multiple, magnitude_multiplier
+from src.explain import get_explanation, all_keys
+from src.utils import fmt_number, fmt_number_array, fmt_pct, fmt_multiple
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Page config & global CSS
@@ -134,36 +137,146 @@ STRIPE_CSS = """
 </style>
 """
 
-st.markdown(STRIPE_CSS, unsafe_allow_html=True)
+
+@st.cache_resource
+def _compact_css() -> str:
+    """STRIPE_CSS with comments and indentation stripped, built once per process."""
+    css = re.sub(r"/\*.*?\*/", "", STRIPE_CSS, flags=re.S)
+    return "".join(line.strip() for line in css.splitlines())
+
+
+# Streamlit drops elements that are not re-emitted, so the style block must be
+# sent on every rerun — keep it as small as possible instead.
+st.markdown(_compact_css(), unsafe_allow_html=True)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Session state init
 # ═══════════════════════════════════════════════════════════════════════════
 
+_DEFAULT_STATE = MappingProxyType({
+    "raw_workbook": None,
+    "file_hash": None,
+    "standardized": None,
+    "mapping_report": None,
+    "exit_multiple_suggestion": None,
+    "include_estimates": False,
+    "confidence_threshold": 0.80,
+    "assumptions": {},
+    "results": {},
+    "active_scenario": "Base",
+    "magnitude": "thousands",
+})
+
+
 def _init_state():
-    defaults = {
-        "raw_workbook": None,
-        "standardized": None,
-        "mapping_report": None,
-        "exit_multiple_suggestion": None,
-        "include_estimates": False,
-        "confidence_threshold": 0.80,
-        "assumptions": {},
-        "results": {},
-        "active_scenario": "Base",
-        "magnitude": "thousands",
-    }
-    for k, v in defaults.items():
+    if st.session_state.get("_state_initialized"):
+        return
+    for k, v in _DEFAULT_STATE.items():
         if k not in st.session_state:
-            st.session_state[k] = v
+            # Fresh containers per session — never share the module-level dicts
+            st.session_state[k] = v.copy() if isinstance(v, dict) else v
+    st.session_state._state_initialized = True
 
 _init_state()
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Cached import pipeline
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _hash_upload(file, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of an uploaded file, read in chunks without copying the buffer."""
+    h = hashlib.sha256()
+    file.seek(0)
+    for chunk in iter(lambda: file.read(chunk_size), b""):
+        h.update(chunk)
+    file.seek(0)
+    return h.hexdigest()
+
+
+@st.cache_data(show_spinner=False)
+def _parse_cached(file_hash: str, _file) -> RawWorkbook:
+    """Parse an upload once per unique file content."""
+    _file.seek(0)
+    return parse_workbook(_file)
+
+
+@st.cache_data(show_spinner=False)
+def _standardize_cached(
+    file_hash: str,
+    _wb: RawWorkbook,
+    include_estimates: bool,
+    threshold: float,
+) -> tuple[StandardizedFinancials, MappingReport, float | None]:
+    """Build standardized financials, keyed on the upload hash + mapping options."""
+    return build_standardized(_wb, include_estimates=include_estimates, threshold=threshold)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Cached valuation runs
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _std_key() -> tuple:
+    """Inputs that fully determine the standardized financials in session state."""
+    return (
+        st.session_state.file_hash,
+        st.session_state.include_estimates,
+        st.session_state.confidence_threshold,
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _dcf_cached(std_key: tuple, assumptions_key: tuple, _std: StandardizedFinancials,
+                _assumptions: DCFAssumptions, magnitude: str) -> DCFResult:
+    return run_dcf(_std, _assumptions, magnitude)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _sensitivity_cached(std_key: tuple, assumptions_key: tuple, _std: StandardizedFinancials,
+                        _assumptions: DCFAssumptions, magnitude: str) -> pd.DataFrame:
+    return run_sensitivity(_std, _assumptions, magnitude=magnitude)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _tornado_cached(std_key: tuple, assumptions_key: tuple, _std: StandardizedFinancials,
+                    _assumptions: DCFAssumptions, magnitude: str) -> list[dict]:
+    return run_tornado(_std, _assumptions, magnitude=magnitude)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Assumption editors
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _driver_editor(
+    assumptions: DCFAssumptions,
+    drivers: dict[str, str],
+    fyears: list[int],
+    fmt: str,
+    key: str,
+) -> None:
+    """Edit percentage drivers in one grid (rows = drivers, columns = years)."""
+    year_cols = [str(y) for y in fyears]
+    df = pd.DataFrame(
+        [[getattr(assumptions, attr).get(y, 0.0) * 100 for y in fyears] for attr in drivers],
+        index=list(drivers.values()),
+        columns=year_cols,
+    )
+    step = 0.1 if fmt.startswith("%.1f") else 0.01
+    edited = st.data_editor(
+        df,
+        key=key,
+        use_container_width=True,
+        column_config={c: st.column_config.NumberColumn(c, format=fmt, step=step) for c in year_cols},
+    ).fillna(df)
+    for attr, label in drivers.items():
+        getattr(assumptions, attr).update(zip(fyears, (edited.loc[label] / 100).tolist()))
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Sidebar navigation
 # ═══════════════════════════════════════════════════════════════════════════
 
-PAGES = ["Import", "Raw Data", "Mapping", "Standardized Financials", "DCF Valuation"]
+PAGES = ("Import", "Raw Data", "Mapping", "Standardized Financials", "DCF Valuation")
+_ALL_KEYS = tuple(all_keys())
 
 with st.sidebar:
     st.markdown("### 📊 DCF Tutor")
@@ -174,7 +287,7 @@ with st.sidebar:
 
     if st.session_state.raw_workbook:
         wb: RawWorkbook = st.session_state.raw_workbook
-        first_sheet = next(iter(wb.sheets.values()), None)
+        first_sheet = wb.first_sheet
         if first_sheet:
             st.caption(f"**Company:** {first_sheet.company_name or 'N/A'}")
             st.caption(f"**Currency:** {first_sheet.currency}")
@@ -194,17 +307,19 @@ if page == "Import":
 
     if uploaded is not None:
         with st.spinner("Parsing workbook..."):
-            wb = parse_workbook(uploaded)
+            file_hash = _hash_upload(uploaded)
+            wb = _parse_cached(file_hash, uploaded)
             st.session_state.raw_workbook = wb
+            st.session_state.file_hash = file_hash
 
             # Detect magnitude from first sheet
-            first_sheet = next(iter(wb.sheets.values()), None)
+            first_sheet = wb.first_sheet
             if first_sheet:
                 st.session_state.magnitude = first_sheet.magnitude
 
             # Build standardized
-            std, report, exit_mult = build_standardized(
-                wb,
+            std, report, exit_mult = _standardize_cached(
+                file_hash, wb,
                 include_estimates=st.session_state.include_estimates,
                 threshold=st.session_state.confidence_threshold,
             )
@@ -276,8 +391,9 @@ elif page == "Mapping":
             if st.button("Rebuild Mapping", type="primary"):
                 st.session_state.confidence_threshold = new_threshold
                 st.session_state.include_estimates = include_est
-                std, report, exit_mult = build_standardized(
-                    wb, include_estimates=include_est, threshold=new_threshold,
+                std, report, exit_mult = _standardize_cached(
+                    st.session_state.file_hash, wb,
+                    include_estimates=include_est, threshold=new_threshold,
                 )
                 st.session_state.standardized = std
                 st.session_state.mapping_report = report
@@ -348,7 +464,6 @@ elif page == "DCF Valuation":
         st.markdown("# DCF Valuation")
 
         mag = st.session_state.magnitude
-        mult = magnitude_multiplier(mag)
 
         # ─── Sidebar controls ──────────────────────────────────────────
         with st.sidebar:
@@ -361,17 +476,10 @@ elif page == "DCF Valuation":
 
         # ─── Build / retrieve assumptions ──────────────────────────────
         if scenario not in st.session_state.assumptions:
-            # Determine last actual year
-            last_actual = None
-            if not std.income_statement.empty:
-                all_years = [int(c) for c in std.income_statement.columns]
-                if all_years:
-                    last_actual = max(all_years)
-
             a = build_default_assumptions(
                 std,
                 forecast_years=forecast_years,
-                last_actual_year=last_actual,
+                last_actual_year=std.years[-1] if std.years else None,
                 magnitude=mag,
                 exit_multiple_suggestion=st.session_state.exit_multiple_suggestion,
             )
@@ -384,20 +492,16 @@ elif page == "DCF Valuation":
         assumptions.terminal_method = terminal_method
 
         # Ensure year dicts match forecast horizon
-        if not std.income_statement.empty:
-            all_years = [int(c) for c in std.income_statement.columns]
-            base_year = max(all_years) if all_years else 2024
-        else:
-            base_year = 2024
+        base_year = std.years[-1] if std.years else 2024
         fyears = list(range(base_year + 1, base_year + 1 + forecast_years))
 
-        for attr in ["revenue_growth", "ebitda_margin", "da_pct_revenue", "tax_rate", "capex_pct_revenue", "nwc_pct_revenue"]:
+        for attr in DRIVER_FIELDS:
             d = getattr(assumptions, attr)
-            for y in fyears:
-                if y not in d:
-                    # Use the first existing value or a default
-                    existing = list(d.values())
-                    d[y] = existing[0] if existing else 0.05
+            missing = set(fyears) - d.keys()
+            if missing:
+                # Use the first existing value or a default
+                first = next(iter(d.values()), 0.05)
+                d.update({y: first for y in missing})
 
         # ─── Assumptions panel ─────────────────────────────────────────
         st.markdown('<div class="section-header">Assumptions</div>', unsafe_allow_html=True)
@@ -406,7 +510,7 @@ elif page == "DCF Valuation":
         bcol1, bcol2 = st.columns(2)
         with bcol1:
             if st.button("Set all years to Year 1 value"):
-                for attr in ["revenue_growth", "ebitda_margin", "da_pct_revenue", "tax_rate", "capex_pct_revenue", "nwc_pct_revenue"]:
+                for attr in DRIVER_FIELDS:
                     d = getattr(assumptions, attr)
                     if fyears and fyears[0] in d:
                         first_val = d[fyears[0]]
@@ -417,73 +521,51 @@ elif page == "DCF Valuation":
             if st.button("Copy Base → Upside & Downside"):
                 if "Base" in st.session_state.assumptions:
                     for s in ["Upside", "Downside"]:
-                        st.session_state.assumptions[s] = copy.deepcopy(st.session_state.assumptions["Base"])
+                        st.session_state.assumptions[s] = st.session_state.assumptions["Base"].clone()
                         st.session_state.assumptions[s].scenario_name = s
                 st.rerun()
 
-        # Basic assumptions — year-by-year editors
-        with st.expander("Basic Assumptions", expanded=True):
-            driver_labels = {
-                "revenue_growth": ("Revenue Growth", True),
-                "ebitda_margin": ("EBITDA Margin", True),
-                "tax_rate": ("Tax Rate", True),
-            }
-            for attr, (label, is_pct) in driver_labels.items():
-                st.markdown(f"**{label}**")
-                cols = st.columns(len(fyears))
-                d = getattr(assumptions, attr)
-                for i, y in enumerate(fyears):
-                    with cols[i]:
-                        val = d.get(y, 0.0)
-                        new_val = st.number_input(
-                            f"{y}", value=val * 100 if is_pct else val,
-                            step=0.5, format="%.1f",
-                            key=f"{scenario}_{attr}_{y}",
-                            label_visibility="visible",
-                        )
-                        d[y] = new_val / 100 if is_pct else new_val
-
-        # Advanced assumptions
-        with st.expander("Advanced Assumptions"):
-            adv_labels = {
-                "da_pct_revenue": ("D&A % of Revenue", True),
-                "capex_pct_revenue": ("Capex % of Revenue", True),
-                "nwc_pct_revenue": ("NWC % of Revenue", True),
-            }
-            for attr, (label, is_pct) in adv_labels.items():
-                st.markdown(f"**{label}**")
-                cols = st.columns(len(fyears))
-                d = getattr(assumptions, attr)
-                for i, y in enumerate(fyears):
-                    with cols[i]:
-                        val = d.get(y, 0.0)
-                        new_val = st.number_input(
-                            f"{y}", value=val * 100, step=0.5, format="%.2f",
-                            key=f"{scenario}_{attr}_{y}_adv",
-                        )
-                        d[y] = new_val / 100
-
-            st.markdown("**Equity Bridge**")
-            c1, c2, c3, c4 = st.columns(4)
-            with c1:
-                assumptions.net_debt = st.number_input("Net Debt ($mm)", value=assumptions.net_debt, step=100.0, key=f"{scenario}_net_debt")
-            with c2:
-                assumptions.preferred_equity = st.number_input("Preferred Equity ($mm)", value=assumptions.preferred_equity, step=10.0, key=f"{scenario}_pref")
-            with c3:
-                assumptions.minority_interest = st.number_input("Minority Interest ($mm)", value=assumptions.minority_interest, step=10.0, key=f"{scenario}_minority")
-            with c4:
-                assumptions.other_adjustments = st.number_input("Other Adj. ($mm)", value=assumptions.other_adjustments, step=10.0, key=f"{scenario}_other")
-
-            st.markdown("**Shares & Terminal**")
-            c1, c2, c3 = st.columns(3)
-            with c1:
-                assumptions.diluted_shares = st.number_input("Diluted Shares (mm)", value=assumptions.diluted_shares, step=1.0, min_value=0.001, key=f"{scenario}_shares")
-            with c2:
-                assumptions.terminal_growth_rate = st.number_input("Terminal Growth (%)", value=assumptions.terminal_growth_rate * 100, step=0.25, key=f"{scenario}_tg") / 100
-            with c3:
-                assumptions.exit_multiple = st.number_input("Exit Multiple (EV/EBITDA)", value=assumptions.exit_multiple, step=0.5, key=f"{scenario}_exit_mult")
-                if st.session_state.exit_multiple_suggestion:
-                    st.caption(f"Suggested: {st.session_state.exit_multiple_suggestion:.1f}x from Multiples tab")
+        # Driver edits are batched in a form so the valuation reruns once per Apply
+        with st.form("assumptions_form"):
+            # Basic assumptions — year-by-year editors
+            with st.expander("Basic Assumptions", expanded=True):
+                _driver_editor(assumptions, {
+                    "revenue_growth": "Revenue Growth",
+                    "ebitda_margin": "EBITDA Margin",
+                    "tax_rate": "Tax Rate",
+                }, fyears, "%.1f%%", key=f"{scenario}_basic_drivers")
+
+            # Advanced assumptions
+            with st.expander("Advanced Assumptions"):
+                _driver_editor(assumptions, {
+                    "da_pct_revenue": "D&A % of Revenue",
+                    "capex_pct_revenue": "Capex % of Revenue",
+                    "nwc_pct_revenue": "NWC % of Revenue",
+                }, fyears, "%.2f%%", key=f"{scenario}_adv_drivers")
+
+                st.markdown("**Equity Bridge**")
+                c1, c2, c3, c4 = st.columns(4)
+                with c1:
+                    assumptions.net_debt = st.number_input("Net Debt ($mm)", value=assumptions.net_debt, step=100.0, key=f"{scenario}_net_debt")
+                with c2:
+                    assumptions.preferred_equity = st.number_input("Preferred Equity ($mm)", value=assumptions.preferred_equity, step=10.0, key=f"{scenario}_pref")
+                with c3:
+                    assumptions.minority_interest = st.number_input("Minority Interest ($mm)", value=assumptions.minority_interest, step=10.0, key=f"{scenario}_minority")
+                with c4:
+                    assumptions.other_adjustments = st.number_input("Other Adj. ($mm)", value=assumptions.other_adjustments, step=10.0, key=f"{scenario}_other")
+
+                st.markdown("**Shares & Terminal**")
+                c1, c2, c3 = st.columns(3)
+                with c1:
+                    assumptions.diluted_shares = st.number_input("Diluted Shares (mm)", value=assumptions.diluted_shares, step=1.0, min_value=0.001, key=f"{scenario}_shares")
+                with c2:
+                    assumptions.terminal_growth_rate = st.number_input("Terminal Growth (%)", value=assumptions.terminal_growth_rate * 100, step=0.25, key=f"{scenario}_tg") / 100
+                with c3:
+                    assumptions.exit_multiple = st.number_input("Exit Multiple (EV/EBITDA)", value=assumptions.exit_multiple, step=0.5, key=f"{scenario}_exit_mult")
+                    if st.session_state.exit_multiple_suggestion:
+                        st.caption(f"Suggested: {st.session_state.exit_multiple_suggestion:.1f}x from Multiples tab")
+
+            st.form_submit_button("Apply Assumptions", type="primary")
 
         # ─── WACC ──────────────────────────────────────────────────────
         with st.expander("WACC Configuration"):
@@ -522,7 +604,9 @@ elif page == "DCF Valuation":
                 assumptions.wacc = st.number_input("WACC (%)", value=assumptions.wacc * 100, step=0.25, key=f"{scenario}_wacc_direct") / 100
 
         # ─── Run DCF ───────────────────────────────────────────────────
-        result = run_dcf(std, assumptions, mag)
+        std_key = _std_key()
+        a_key = assumptions.cache_key()
+        result = _dcf_cached(std_key, a_key, std, assumptions, mag)
         st.session_state.results[scenario] = result
 
         # ─── Summary cards ─────────────────────────────────────────────
@@ -563,52 +647,64 @@ elif page == "DCF Valuation":
         ft = result.forecast_table
         if not ft.empty:
             # Format display
-            pct_rows = {"Revenue Growth", "EBITDA Margin"}
-            display_df = ft.copy()
-            for row_name in display_df.index:
-                for col in display_df.columns:
-                    val = display_df.at[row_name, col]
-                    if row_name in pct_rows:
-                        display_df.at[row_name, col] = f"{val * 100:.1f}%" if pd.notna(val) else "—"
-                    else:
-                        display_df.at[row_name, col] = fmt_number(val, 1, "$", "M") if pd.notna(val) else "—"
-            st.dataframe(display_df, use_container_width=True)
+            pct_rows = pd.IndexSlice[["Revenue Growth", "EBITDA Margin"], :]
+            styler = (
+                ft.style
+                .format(lambda v: fmt_number(v, 1, "$", "M"))
+                .format(fmt_pct, subset=pct_rows)
+            )
+            st.dataframe(styler, use_container_width=True)
 
         # ─── PV Breakdown ─────────────────────────────────────────────
         st.markdown('<div class="section-header">Present Value Breakdown</div>', unsafe_allow_html=True)
-        pv_data = {
-            "Year": list(result.pv_fcff.keys()) + ["Terminal"],
-            "PV ($mm)": [fmt_number(v, 1, "$", "M") for v in result.pv_fcff.values()] + [fmt_number(result.pv_terminal, 1, "$", "M")],
-        }
-        st.dataframe(pd.DataFrame(pv_data), use_container_width=True, hide_index=True)
+        # Built straight from the PV array: one formatting pass, one frame
+        pv_table = pd.DataFrame({
+            "Year": [*map(str, result.pv_fcff.index), "Terminal"],
+            "PV ($mm)": fmt_number_array(np.append(result.pv_fcff.to_numpy(), result.pv_terminal), 1, "$", "M"),
+        })
+        st.dataframe(pv_table, use_container_width=True, hide_index=True)
 
         # ─── Charts ───────────────────────────────────────────────────
         st.markdown('<div class="section-header">Charts</div>', unsafe_allow_html=True)
 
         chart_col1, chart_col2 = st.columns(2)
         with chart_col1:
-            st.plotly_chart(ev_to_equity_waterfall(result), use_container_width=True)
+            st.plotly_chart(
+                ev_to_equity_waterfall(result),
+                use_container_width=True,
+            )
         with chart_col2:
-            st.plotly_chart(explicit_vs_terminal_pie(result), use_container_width=True)
-
-        chart_col3, chart_col4 = st.columns(2)
-        with chart_col3:
-            st.plotly_chart(revenue_ebitda_fcff_bars(std.income_statement, result, mag), use_container_width=True)
-        with chart_col4:
-            st.plotly_chart(margin_trend(std.income_statement, result, mag), use_container_width=True)
+            st.plotly_chart(
+                explicit_vs_terminal_pie(result),
+                use_container_width=True,
+            )
 
-        chart_col5, chart_col6 = st.columns(2)
-        with chart_col5:
-            st.plotly_chart(pv_cash_flows_chart(result), use_container_width=True)
-        with chart_col6:
-            st.plotly_chart(reinvestment_vs_growth(result), use_container_width=True)
+        # Secondary charts: only the selected figure is built and sent to the browser
+        # (st.tabs would still execute every tab body on each rerun)
+        detail_builders = {
+            "Revenue / EBITDA / FCFF": lambda: revenue_ebitda_fcff_bars(std.income_statement, result, mag),
+            "Margin Trend": lambda: margin_trend(std.income_statement, result, mag),
+            "PV Breakdown": lambda: pv_cash_flows_chart(result),
+            "Reinvestment": lambda: reinvestment_vs_growth(result),
+        }
+        detail_chart = st.radio(
+            "Detail chart",
+            list(detail_builders),
+            horizontal=True,
+            label_visibility="collapsed",
+            key="detail_chart",
+        )
+        st.plotly_chart(detail_builders[detail_chart](), use_container_width=True)
 
         # ─── Sensitivity Table ─────────────────────────────────────────
         st.markdown('<div class="section-header">Sensitivity Analysis</div>', unsafe_allow_html=True)
         st.caption("WACC vs Terminal Growth Rate — Implied Price per Share")
 
-        sens_df = run_sensitivity(std, assumptions, magnitude=mag)
-        st.plotly_chart(sensitivity_heatmap(sens_df, result.price_per_share), use_container_width=True)
+        sens_df = _sensitivity_cached(std_key, a_key, std, assumptions, mag)
+        st.plotly_chart(
+            sensitivity_heatmap(sens_df, result.price_per_share),
+            use_container_width=True,
+        )
 
         # Also show as table
         with st.expander("Sensitivity Table (raw)"):
@@ -619,21 +715,22 @@ elif page == "DCF Valuation":
 
         # ─── Tornado Chart ─────────────────────────────────────────────
         st.markdown('<div class="section-header">Tornado Analysis</div>', unsafe_allow_html=True)
-        tornado_data = run_tornado(std, assumptions, magnitude=mag)
-        st.plotly_chart(tornado_chart(tornado_data), use_container_width=True)
+        tornado_data = _tornado_cached(std_key, a_key, std, assumptions, mag)
+        st.plotly_chart(
+            tornado_chart(tornado_data),
+            use_container_width=True,
+        )
 
         # Tornado table
         with st.expander("Tornado Table (raw)"):
-            t_rows = []
-            for d in tornado_data:
-                t_rows.append({
-                    "Variable": d["label"],
-                    "Low PPS": fmt_number(d["low"], 2, "$"),
-                    "Base PPS": fmt_number(d["base"], 2, "$"),
-                    "High PPS": fmt_number(d["high"], 2, "$"),
-                    "Spread": fmt_number(d["high"] - d["low"], 2, "$"),
-                })
-            st.dataframe(pd.DataFrame(t_rows), use_container_width=True, hide_index=True)
+            t_df = pd.DataFrame(tornado_data, columns=["label", "low", "base", "high"])
+            t_df["Spread"] = t_df["high"] - t_df["low"]
+            t_df = t_df.rename(columns={
+                "label": "Variable", "low": "Low PPS", "base": "Base PPS", "high": "High PPS",
+            })
+            price_cols = ["Low PPS", "Base PPS", "High PPS", "Spread"]
+            t_df[price_cols] = t_df[price_cols].map(lambda v: fmt_number(v, 2, "$"))
+            st.dataframe(t_df, use_container_width=True, hide_index=True)
 
         # ─── WACC Explanation ──────────────────────────────────────────
         st.markdown('<div class="section-header">WACC Methodology</div>', unsafe_allow_html=True)
@@ -665,8 +762,8 @@ elif page == "DCF Valuation":
 
         explain_key = st.selectbox(
             "Select concept",
-            all_keys(),
-            format_func=lambda k: EXPLANATIONS[k].title,
+            _ALL_KEYS,
+            format_func=lambda k: get_explanation(k).title,
         )
 
         exp = get_explanation(explain_key)
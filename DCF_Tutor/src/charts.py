@@ -4,11 +4,12 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import plotly.graph_objects as go
 import pandas as pd
 
 from .models import DCFResult
-from .utils import fmt_number, fmt_pct
+from .utils import fmt_number, fmt_number_array, fmt_pct, magnitude_multiplier
 
 # ---------------------------------------------------------------------------
 # Theme constants (Stripe-inspired)
@@ -49,9 +50,8 @@ _LAYOUT_DEFAULTS = dict(
 )
 
 
-def _apply_theme(fig: go.Figure) -> go.Figure:
-    fig.update_layout(**_LAYOUT_DEFAULTS)
-    return fig
+# Validated once at import; each chart starts from a copy instead of re-applying the dict
+_THEMED_LAYOUT = go.Layout(**_LAYOUT_DEFAULTS)
 
 
 # ---------------------------------------------------------------------------
@@ -94,9 +94,9 @@ def ev_to_equity_waterfall(result: DCFResult) -> go.Figure:
         totals=dict(marker=dict(color=DARK_TEXT)),
         textposition="outside",
         text=[fmt_number(v, decimals=0, prefix="$", suffix="M") if v != 0 else "" for v in values],
-    ))
+    ), layout=_THEMED_LAYOUT)
     fig.update_layout(title="EV to Equity Bridge", showlegend=False)
-    return _apply_theme(fig)
+    return fig
 
 
 # ---------------------------------------------------------------------------
@@ -109,16 +109,20 @@ def revenue_ebitda_fcff_bars(
     magnitude: str = "thousands",
 ) -> go.Figure:
     """Grouped bars for Revenue, EBITDA, FCFF across historical + forecast."""
-    from .utils import magnitude_multiplier
     mult = magnitude_multiplier(magnitude)
 
-    fig = go.Figure()
+    fig = go.Figure(layout=_THEMED_LAYOUT)
 
     # Historical
     if not historical_is.empty and "Revenue" in historical_is.index:
-        hist_years = [int(c) for c in historical_is.columns]
-        rev_hist = [float(historical_is.at["Revenue", y]) * mult if pd.notna(historical_is.at["Revenue", y]) else 0 for y in hist_years]
-        ebitda_hist = [float(historical_is.at["EBITDA", y]) * mult if "EBITDA" in historical_is.index and pd.notna(historical_is.at["EBITDA", y]) else 0 for y in hist_years]
+        hist_years = historical_is.columns.astype(int)
+        rev_vals = historical_is.loc["Revenue"].to_numpy(dtype=float)
+        rev_hist = np.where(np.isnan(rev_vals), 0.0, rev_vals * mult)
+        if "EBITDA" in historical_is.index:
+            ebitda_vals = historical_is.loc["EBITDA"].to_numpy(dtype=float)
+            ebitda_hist = np.where(np.isnan(ebitda_vals), 0.0, ebitda_vals * mult)
+        else:
+            ebitda_hist = np.zeros_like(rev_hist)
 
         fig.add_trace(go.Bar(x=hist_years, y=rev_hist, name="Revenue (Hist)", marker_color=HISTORICAL_COLOR, opacity=0.7))
         fig.add_trace(go.Bar(x=hist_years, y=ebitda_hist, name="EBITDA (Hist)", marker_color="#B0BEC5", opacity=0.7))
@@ -126,10 +130,10 @@ def revenue_ebitda_fcff_bars(
     # Forecast
     ft = result.forecast_table
     if not ft.empty:
-        fyears = [int(c) for c in ft.columns]
-        fig.add_trace(go.Bar(x=fyears, y=[ft.at["Revenue", y] for y in fyears], name="Revenue (Fcst)", marker_color=ACCENT))
-        fig.add_trace(go.Bar(x=fyears, y=[ft.at["EBITDA", y] for y in fyears], name="EBITDA (Fcst)", marker_color=TERMINAL_COLOR))
-        fig.add_trace(go.Bar(x=fyears, y=[ft.at["FCFF", y] for y in fyears], name="FCFF (Fcst)", marker_color=POSITIVE))
+        fyears = ft.columns.astype(int)
+        fig.add_trace(go.Bar(x=fyears, y=ft.loc["Revenue"].to_numpy(), name="Revenue (Fcst)", marker_color=ACCENT))
+        fig.add_trace(go.Bar(x=fyears, y=ft.loc["EBITDA"].to_numpy(), name="EBITDA (Fcst)", marker_color=TERMINAL_COLOR))
+        fig.add_trace(go.Bar(x=fyears, y=ft.loc["FCFF"].to_numpy(), name="FCFF (Fcst)", marker_color=POSITIVE))
 
     fig.update_layout(
         title="Revenue, EBITDA & FCFF",
@@ -137,7 +141,7 @@ def revenue_ebitda_fcff_bars(
         xaxis_title="Year",
         yaxis_title="USD (mm)",
     )
-    return _apply_theme(fig)
+    return fig
 
 
 # ---------------------------------------------------------------------------
@@ -150,19 +154,16 @@ def margin_trend(
     magnitude: str = "thousands",
 ) -> go.Figure:
     """Line chart of EBITDA margin over time."""
-    fig = go.Figure()
+    fig = go.Figure(layout=_THEMED_LAYOUT)
 
     # Historical margins
     if not historical_is.empty and "Revenue" in historical_is.index and "EBITDA" in historical_is.index:
-        hist_years = [int(c) for c in historical_is.columns]
-        margins = []
-        for y in hist_years:
-            r = historical_is.at["Revenue", y]
-            e = historical_is.at["EBITDA", y]
-            if pd.notna(r) and pd.notna(e) and r != 0:
-                margins.append(float(e / r))
-            else:
-                margins.append(None)
+        hist_years = historical_is.columns.astype(int)
+        r = historical_is.loc["Revenue"].to_numpy(dtype=float)
+        e = historical_is.loc["EBITDA"].to_numpy(dtype=float)
+        valid = np.isfinite(r) & np.isfinite(e) & (r != 0)
+        # NaN leaves a gap in the line, as None did
+        margins = np.divide(e, r, out=np.full_like(r, np.nan), where=valid)
         fig.add_trace(go.Scatter(
             x=hist_years, y=margins, name="Historical",
             mode="lines+markers",
@@ -173,8 +174,8 @@ def margin_trend(
     # Forecast margins
     ft = result.forecast_table
     if not ft.empty and "EBITDA Margin" in ft.index:
-        fyears = [int(c) for c in ft.columns]
-        fmargins = [ft.at["EBITDA Margin", y] for y in fyears]
+        fyears = ft.columns.astype(int)
+        fmargins = ft.loc["EBITDA Margin"].to_numpy()
         fig.add_trace(go.Scatter(
             x=fyears, y=fmargins, name="Forecast",
             mode="lines+markers",
@@ -188,7 +189,7 @@ def margin_trend(
         yaxis_title="Margin",
         yaxis_tickformat=".1%",
     )
-    return _apply_theme(fig)
+    return fig
 
 
 # ---------------------------------------------------------------------------
@@ -197,14 +198,14 @@ def margin_trend(
 
 def pv_cash_flows_chart(result: DCFResult) -> go.Figure:
     """Bar chart of PV of FCFF by forecast year + terminal."""
-    years = sorted(result.pv_fcff.keys())
-    pvs = [result.pv_fcff[y] for y in years]
+    years = result.pv_fcff.index
+    pvs = result.pv_fcff.to_numpy()
 
     colors = [ACCENT] * len(years)
 
-    fig = go.Figure()
+    fig = go.Figure(layout=_THEMED_LAYOUT)
     fig.add_trace(go.Bar(
-        x=[str(y) for y in years], y=pvs,
+        x=years.astype(str), y=pvs,
         name="PV of FCFF", marker_color=colors,
     ))
     fig.add_trace(go.Bar(
@@ -218,7 +219,7 @@ def pv_cash_flows_chart(result: DCFResult) -> go.Figure:
         xaxis_title="Year",
         yaxis_title="PV (USD mm)",
     )
-    return _apply_theme(fig)
+    return fig
 
 
 # ---------------------------------------------------------------------------
@@ -234,9 +235,9 @@ def explicit_vs_terminal_pie(result: DCFResult) -> go.Figure:
         hole=0.4,
         textinfo="label+percent",
         textfont=dict(size=13),
-    ))
+    ), layout=_THEMED_LAYOUT)
     fig.update_layout(title="Value Composition", showlegend=True)
-    return _apply_theme(fig)
+    return fig
 
 
 # ---------------------------------------------------------------------------
@@ -248,20 +249,22 @@ def tornado_chart(tornado_data: list[dict[str, Any]]) -> go.Figure:
     labels = [d["label"] for d in tornado_data]
     base_pps = tornado_data[0]["base"] if tornado_data else 0
 
-    lows = [d["low"] - base_pps for d in tornado_data]
-    highs = [d["high"] - base_pps for d in tornado_data]
+    low_pps = np.array([d["low"] for d in tornado_data], dtype=float)
+    high_pps = np.array([d["high"] for d in tornado_data], dtype=float)
+    lows = low_pps - base_pps
+    highs = high_pps - base_pps
 
-    fig = go.Figure()
+    fig = go.Figure(layout=_THEMED_LAYOUT)
     fig.add_trace(go.Bar(
         y=labels, x=lows, orientation="h",
         name="Downside", marker_color=NEGATIVE,
-        text=[fmt_number(v, 2, "$") for v in [d["low"] for d in tornado_data]],
+        text=fmt_number_array(low_pps, 2, "$"),
         textposition="outside",
     ))
     fig.add_trace(go.Bar(
         y=labels, x=highs, orientation="h",
         name="Upside", marker_color=POSITIVE,
-        text=[fmt_number(v, 2, "$") for v in [d["high"] for d in tornado_data]],
+        text=fmt_number_array(high_pps, 2, "$"),
         textposition="outside",
     ))
 
@@ -271,7 +274,7 @@ def tornado_chart(tornado_data: list[dict[str, Any]]) -> go.Figure:
         xaxis_title="Impact on Price per Share (USD)",
         yaxis=dict(autorange="reversed"),
     )
-    return _apply_theme(fig)
+    return fig
 
 
 # ---------------------------------------------------------------------------
@@ -285,7 +288,7 @@ def sensitivity_heatmap(sensitivity_df: pd.DataFrame, base_pps: float = 0) -> go
     y_labels = [f"{w:.1%}" for w in sensitivity_df.index]
 
     # Custom text with $ formatting
-    text = [[fmt_number(v, 2, "$") for v in row] for row in z]
+    text = fmt_number_array(z, 2, "$")
 
     fig = go.Figure(go.Heatmap(
         z=z, x=x_labels, y=y_labels,
@@ -297,7 +300,7 @@ def sensitivity_heatmap(sensitivity_df: pd.DataFrame, base_pps: float = 0) -> go
         ],
         colorbar=dict(title="PPS"),
         hovertemplate="WACC: %{y}<br>Growth: %{x}<br>PPS: %{text}<extra></extra>",
-    ))
+    ), layout=_THEMED_LAYOUT)
 
     fig.update_layout(
         title="Sensitivity: WACC vs Terminal Growth",
@@ -305,7 +308,7 @@ def sensitivity_heatmap(sensitivity_df: pd.DataFrame, base_pps: float = 0) -> go
         yaxis_title="WACC",
         yaxis=dict(autorange="reversed"),
     )
-    return _apply_theme(fig)
+    return fig
 
 
 # ---------------------------------------------------------------------------
@@ -318,12 +321,12 @@ def reinvestment_vs_growth(result: DCFResult) -> go.Figure:
     if ft.empty:
         return go.Figure()
 
-    years = [int(c) for c in ft.columns]
-    capex = [ft.at["Capex", y] for y in years]
-    nwc = [ft.at["Change in NWC", y] for y in years]
-    rev_growth = [ft.at["Revenue Growth", y] for y in years]
+    years = ft.columns.astype(int)
+    capex = ft.loc["Capex"].to_numpy()
+    nwc = ft.loc["Change in NWC"].to_numpy()
+    rev_growth = ft.loc["Revenue Growth"].to_numpy()
 
-    fig = go.Figure()
+    fig = go.Figure(layout=_THEMED_LAYOUT)
     fig.add_trace(go.Bar(x=years, y=capex, name="Capex", marker_color=ACCENT))
     fig.add_trace(go.Bar(x=years, y=nwc, name="Change in NWC", marker_color=TERMINAL_COLOR))
     fig.add_trace(go.Scatter(
@@ -343,4 +346,4 @@ def reinvestment_vs_growth(result: DCFResult) -> go.Figure:
             tickformat=".1%", gridcolor="rgba(0,0,0,0)",
         ),
     )
-    return _apply_theme(fig)
+    return fig
@@ -2,20 +2,46 @@
 
 from __future__ import annotations
 
-import copy
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
-from .models import DCFAssumptions, DCFResult, StandardizedFinancials
+from .models import DRIVER_FIELDS, DCFAssumptions, DCFResult, DriverArrays, StandardizedFinancials
 from .utils import magnitude_multiplier
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional — without it the vectorized NumPy path is used
+    njit = None
+
 
 # ---------------------------------------------------------------------------
 # Build default assumptions from historical data
 # ---------------------------------------------------------------------------
 
+def _row(df: pd.DataFrame, name: str) -> pd.Series | None:
+    """Non-null values of one statement row, or None when the row is absent."""
+    if df.empty or name not in df.index:
+        return None
+    return df.loc[name].dropna()
+
+
+def _last_ratio(num: pd.Series | None, den: pd.Series | None) -> float | None:
+    """num / den in the latest year both rows cover; None if missing or den is zero."""
+    if num is None or den is None:
+        return None
+    common = den.index.intersection(num.index)
+    if len(common) == 0:
+        return None
+    last = common[-1]
+    d = den[last]
+    if not d:
+        return None
+    return float(num[last] / d)
+
+
 def build_default_assumptions(
     std: StandardizedFinancials,
     forecast_years: int = 5,
@@ -34,106 +60,83 @@ def build_default_assumptions(
     if last_actual_year:
         base_year = last_actual_year
     elif not is_df.empty:
-        base_year = max(int(c) for c in is_df.columns)
+        base_year = int(is_df.columns.astype(int).max())
     else:
         base_year = 2024
 
     forecast_start = base_year + 1
     fyears = list(range(forecast_start, forecast_start + forecast_years))
 
+    # Pull each statement row once; consumers below share the same Series
+    revs = _row(is_df, "Revenue")
+
     # Revenue growth — average of last 3 years, clamped
     rev_growth = 0.05
-    if not is_df.empty and "Revenue" in is_df.index:
-        revs = is_df.loc["Revenue"].dropna()
-        if len(revs) >= 2:
-            growths = revs.pct_change().dropna().tail(3)
-            if len(growths) > 0:
-                avg_g = float(growths.mean())
-                rev_growth = max(-0.10, min(avg_g, 0.30))
+    if revs is not None and len(revs) >= 2:
+        growths = revs.pct_change().dropna().tail(3)
+        if len(growths) > 0:
+            avg_g = float(growths.mean())
+            rev_growth = max(-0.10, min(avg_g, 0.30))
 
     # EBITDA margin — last year
     ebitda_margin = 0.20
-    if not is_df.empty and "Revenue" in is_df.index and "EBITDA" in is_df.index:
-        revs = is_df.loc["Revenue"].dropna()
-        ebs = is_df.loc["EBITDA"].dropna()
-        common = revs.index.intersection(ebs.index)
-        if len(common) > 0:
-            last = common[-1]
-            r, e = revs[last], ebs[last]
-            if r and r != 0:
-                ebitda_margin = max(0.0, min(float(e / r), 0.60))
+    ratio = _last_ratio(_row(is_df, "EBITDA"), revs)
+    if ratio is not None:
+        ebitda_margin = max(0.0, min(ratio, 0.60))
 
     # D&A % of revenue
     da_pct = 0.03
-    if not is_df.empty and "Revenue" in is_df.index and "DA" in is_df.index:
-        revs = is_df.loc["Revenue"].dropna()
-        das = is_df.loc["DA"].dropna()
-        common = revs.index.intersection(das.index)
-        if len(common) > 0:
-            last = common[-1]
-            r, d = revs[last], das[last]
-            if r and r != 0:
-                da_pct = max(0.0, min(abs(float(d / r)), 0.15))
+    ratio = _last_ratio(_row(is_df, "DA"), revs)
+    if ratio is not None:
+        da_pct = max(0.0, min(abs(ratio), 0.15))
 
     # Tax rate
     tax_rate = 0.21
-    if not is_df.empty and "Pretax Income" in is_df.index and "Taxes" in is_df.index:
-        pti = is_df.loc["Pretax Income"].dropna()
-        taxes = is_df.loc["Taxes"].dropna()
-        common = pti.index.intersection(taxes.index)
-        if len(common) > 0:
-            last = common[-1]
-            p, t = pti[last], taxes[last]
-            if p and p != 0:
-                implied = abs(float(t / p))
-                tax_rate = max(0.0, min(implied, 0.40))
+    ratio = _last_ratio(_row(is_df, "Taxes"), _row(is_df, "Pretax Income"))
+    if ratio is not None:
+        tax_rate = max(0.0, min(abs(ratio), 0.40))
 
     # Capex % of revenue
     capex_pct = 0.05
-    if not cf_df.empty and "Capex" in cf_df.index and not is_df.empty and "Revenue" in is_df.index:
-        revs = is_df.loc["Revenue"].dropna()
-        capexes = cf_df.loc["Capex"].dropna()
-        common = revs.index.intersection(capexes.index)
-        if len(common) > 0:
-            last = common[-1]
-            r, c = revs[last], capexes[last]
-            if r and r != 0:
-                capex_pct = max(0.0, min(abs(float(c / r)), 0.20))
+    ratio = _last_ratio(_row(cf_df, "Capex"), revs)
+    if ratio is not None:
+        capex_pct = max(0.0, min(abs(ratio), 0.20))
 
     # NWC % of revenue
     nwc_pct = 0.02
 
-    # Populate year-by-year dicts
-    for y in fyears:
-        a.revenue_growth[y] = rev_growth
-        a.ebitda_margin[y] = ebitda_margin
-        a.da_pct_revenue[y] = da_pct
-        a.tax_rate[y] = tax_rate
-        a.capex_pct_revenue[y] = capex_pct
-        a.nwc_pct_revenue[y] = nwc_pct
+    # Flat drivers across the horizon, set as dense arrays in one go
+    n = len(fyears)
+    a.set_drivers(DriverArrays(
+        years=tuple(fyears),
+        revenue_growth=np.full(n, rev_growth),
+        ebitda_margin=np.full(n, ebitda_margin),
+        da_pct_revenue=np.full(n, da_pct),
+        tax_rate=np.full(n, tax_rate),
+        capex_pct_revenue=np.full(n, capex_pct),
+        nwc_pct_revenue=np.full(n, nwc_pct),
+    ))
 
     # Net Debt from balance sheet
-    if not bs_df.empty and "Net Debt" in bs_df.index:
-        nd_row = bs_df.loc["Net Debt"].dropna()
+    nd_row = _row(bs_df, "Net Debt")
+    if nd_row is not None:
         if len(nd_row) > 0:
             a.net_debt = float(nd_row.iloc[-1]) * mult  # convert to millions
-    elif not bs_df.empty and "Total Debt" in bs_df.index and "Cash" in bs_df.index:
-        debt_row = bs_df.loc["Total Debt"].dropna()
-        cash_row = bs_df.loc["Cash"].dropna()
-        common = debt_row.index.intersection(cash_row.index)
+    else:
+        debt_row, cash_row = _row(bs_df, "Total Debt"), _row(bs_df, "Cash")
+        common = debt_row.index.intersection(cash_row.index) if debt_row is not None and cash_row is not None else []
         if len(common) > 0:
             last = common[-1]
             a.net_debt = (float(debt_row[last]) - float(cash_row[last])) * mult
 
     # Diluted shares
-    if not is_df.empty and "Diluted Shares" in is_df.index:
-        shares_row = is_df.loc["Diluted Shares"].dropna()
-        if len(shares_row) > 0:
-            # Shares in CIQ are actual units; convert to millions
-            a.diluted_shares = float(shares_row.iloc[-1]) / 1_000_000.0
-            if a.diluted_shares < 0.001:
-                # Likely already in millions
-                a.diluted_shares = float(shares_row.iloc[-1])
+    shares_row = _row(is_df, "Diluted Shares")
+    if shares_row is not None and len(shares_row) > 0:
+        # Shares in CIQ are actual units; convert to millions
+        a.diluted_shares = float(shares_row.iloc[-1]) / 1_000_000.0
+        if a.diluted_shares < 0.001:
+            # Likely already in millions
+            a.diluted_shares = float(shares_row.iloc[-1])
 
     # Exit multiple
     if exit_multiple_suggestion:
@@ -146,105 +149,127 @@ def build_default_assumptions(
 # Run DCF
 # ---------------------------------------------------------------------------
 
-def run_dcf(
-    std: StandardizedFinancials,
-    assumptions: DCFAssumptions,
-    magnitude: str = "thousands",
-) -> DCFResult:
-    """Execute the DCF and return full results."""
-    mult = magnitude_multiplier(magnitude)
-    is_df = std.income_statement
-    a = assumptions
-    wacc = a.effective_wacc
-
-    # Determine base-year revenue
-    base_revenue = 0.0
-    if not is_df.empty and "Revenue" in is_df.index:
-        revs = is_df.loc["Revenue"].dropna()
-        if len(revs) > 0:
-            base_revenue = float(revs.iloc[-1]) * mult  # convert to millions
-
-    if base_revenue == 0:
-        base_revenue = 1000.0  # fallback
+# Built once and shared by every forecast table (Index objects are immutable)
+_FORECAST_ROWS = pd.Index([
+    "Revenue", "Revenue Growth", "EBITDA", "EBITDA Margin", "D&A", "EBIT",
+    "Taxes", "NOPAT", "Capex", "Change in NWC", "FCFF",
+])
 
-    fyears = sorted(a.revenue_growth.keys())
-    if not fyears:
-        return DCFResult(scenario_name=a.scenario_name)
 
-    # Build forecast table
-    rows: dict[str, dict[int, float]] = {
-        "Revenue": {},
-        "Revenue Growth": {},
-        "EBITDA": {},
-        "EBITDA Margin": {},
-        "D&A": {},
-        "EBIT": {},
-        "Taxes": {},
-        "NOPAT": {},
-        "Capex": {},
-        "Change in NWC": {},
-        "FCFF": {},
-    }
+def _forecast_vectorized(base_revenue, growth, margin, da_pct, tax_rate, capex_pct, nwc_pct, wacc):
+    """Forecast and mid-year discounting as whole-array NumPy ops.
 
+    Driver arrays are (n,) or (S, n) with years on the last axis; wacc is a
+    scalar or broadcasts against the leading axes. Returns the rows stacked on
+    a new first axis: revenue, ebitda, da, ebit, tax, nopat, capex, dnwc,
+    fcff, pv_fcff.
+    """
+    revenue = base_revenue * np.cumprod(1.0 + growth, axis=-1)
+    ebitda = revenue * margin
+    da = revenue * da_pct
+    ebit = ebitda - da
+    tax = np.maximum(ebit, 0.0) * tax_rate
+    nopat = ebit - tax
+    capex = revenue * capex_pct
+    dnwc = revenue * nwc_pct
+    fcff = nopat + da - capex - dnwc
+    pv = fcff / (1.0 + wacc) ** (np.arange(growth.shape[-1]) + 0.5)  # mid-year
+    return np.stack([revenue, ebitda, da, ebit, tax, nopat, capex, dnwc, fcff, pv])
+
+
+def _forecast_loop(base_revenue, growth, margin, da_pct, tax_rate, capex_pct, nwc_pct, wacc):
+    """Scalar-loop twin of _forecast_vectorized for (n,) drivers, compiled by numba."""
+    n = growth.shape[0]
+    out = np.empty((10, n))
     prev_revenue = base_revenue
-    for y in fyears:
-        g = a.revenue_growth.get(y, 0.05)
-        revenue = prev_revenue * (1.0 + g)
-        ebitda = revenue * a.ebitda_margin.get(y, 0.20)
-        da = revenue * a.da_pct_revenue.get(y, 0.03)
+    for i in range(n):
+        revenue = prev_revenue * (1.0 + growth[i])
+        ebitda = revenue * margin[i]
+        da = revenue * da_pct[i]
         ebit = ebitda - da
-        tax = max(0.0, ebit) * a.tax_rate.get(y, 0.21)
+        tax = max(0.0, ebit) * tax_rate[i]
         nopat = ebit - tax
-        capex = revenue * a.capex_pct_revenue.get(y, 0.05)
-        dnwc = revenue * a.nwc_pct_revenue.get(y, 0.02)
+        capex = revenue * capex_pct[i]
+        dnwc = revenue * nwc_pct[i]
         fcff = nopat + da - capex - dnwc
+        out[0, i] = revenue
+        out[1, i] = ebitda
+        out[2, i] = da
+        out[3, i] = ebit
+        out[4, i] = tax
+        out[5, i] = nopat
+        out[6, i] = capex
+        out[7, i] = dnwc
+        out[8, i] = fcff
+        out[9, i] = fcff / (1.0 + wacc) ** (i + 0.5)  # mid-year
+        prev_revenue = revenue
+    return out
 
-        rows["Revenue"][y] = revenue
-        rows["Revenue Growth"][y] = g
-        rows["EBITDA"][y] = ebitda
-        rows["EBITDA Margin"][y] = a.ebitda_margin.get(y, 0.20)
-        rows["D&A"][y] = da
-        rows["EBIT"][y] = ebit
-        rows["Taxes"][y] = tax
-        rows["NOPAT"][y] = nopat
-        rows["Capex"][y] = capex
-        rows["Change in NWC"][y] = dnwc
-        rows["FCFF"][y] = fcff
 
-        prev_revenue = revenue
+def _kernel_signature(layout: str) -> str:
+    return "float64[:, ::1](float64, " + ", ".join([f"float64[{layout}]"] * 6) + ", float64)"
+
 
-    forecast_table = pd.DataFrame(rows).T
-    forecast_table.columns = fyears
+# Single-scenario kernel used by run_dcf: machine code under numba, NumPy otherwise.
+# Compiled eagerly — scalar base revenue, six (n,) float64 driver arrays, scalar
+# WACC — so the first valuation of a session does not stall on JIT compilation
+# (the on-disk cache makes later imports cheap). The C-contiguous variant, which
+# driver_arrays always produces, lets LLVM drop stride arithmetic; the any-layout
+# one keeps strided views working. The horizon stays a runtime length: numba has
+# no fixed-size array types, and per-length kernels would only buy unrolling of a
+# loop that runs 3–10 times.
+_KERNEL_SIGNATURES = [_kernel_signature("::1"), _kernel_signature(":")]
+_dcf_core = njit(_KERNEL_SIGNATURES, cache=True)(_forecast_loop) if njit is not None else _forecast_vectorized
 
-    # Discount FCFF — mid-year convention
-    pv_fcff: dict[int, float] = {}
-    for i, y in enumerate(fyears):
-        t = i + 0.5  # mid-year
-        pv = rows["FCFF"][y] / ((1.0 + wacc) ** t)
-        pv_fcff[y] = pv
 
-    pv_explicit = sum(pv_fcff.values())
+def _base_revenue(std: StandardizedFinancials, magnitude: str) -> float:
+    """Last actual revenue in millions (1000.0 fallback when unavailable)."""
+    is_df = std.income_statement
+    base_revenue = 0.0
+    if not is_df.empty and "Revenue" in is_df.index:
+        revs = is_df.loc["Revenue"].dropna()
+        if len(revs) > 0:
+            base_revenue = float(revs.iloc[-1]) * magnitude_multiplier(magnitude)  # convert to millions
 
-    # Terminal value
-    last_year = fyears[-1]
-    last_fcff = rows["FCFF"][last_year]
-    n = len(fyears)  # number of explicit forecast years
+    if base_revenue == 0:
+        base_revenue = 1000.0  # fallback
+    return base_revenue
 
-    if a.terminal_method == "exit_multiple":
-        last_ebitda = rows["EBITDA"][last_year]
-        tv = last_ebitda * a.exit_multiple
-    else:
-        # Perpetuity growth
-        fcff_next = last_fcff * (1.0 + a.terminal_growth_rate)
-        tv = fcff_next / (wacc - a.terminal_growth_rate) if wacc > a.terminal_growth_rate else 0.0
 
-    # Discount TV to present (end of last forecast year)
-    pv_tv = tv / ((1.0 + wacc) ** n)
+def run_dcf(
+    std: StandardizedFinancials,
+    assumptions: DCFAssumptions,
+    magnitude: str = "thousands",
+) -> DCFResult:
+    """Execute the DCF and return full results."""
+    a = assumptions
+    wacc = a.effective_wacc
+    base_revenue = _base_revenue(std, magnitude)
 
-    # Enterprise and equity value
-    ev = pv_explicit + pv_tv
-    equity = ev - a.net_debt - a.preferred_equity - a.minority_interest + a.other_adjustments
-    pps = equity / a.diluted_shares if a.diluted_shares > 0 else 0.0
+    d = a.driver_arrays()
+    fyears = list(d.years)
+    if not fyears:
+        return DCFResult(scenario_name=a.scenario_name)
+
+    n = len(fyears)
+    year_index = pd.Index(fyears)
+    growth, margin = d.revenue_growth, d.ebitda_margin
+    out = _dcf_core(base_revenue, *d.ordered(), wacc)
+    revenue, ebitda, da, ebit, tax, nopat, capex, dnwc, fcff, pv = out
+
+    forecast_table = pd.DataFrame(
+        np.vstack([revenue, growth, ebitda, margin, da, ebit, tax, nopat, capex, dnwc, fcff]),
+        index=_FORECAST_ROWS,
+        columns=year_index,
+        copy=False,  # vstack already produced a fresh block
+    )
+
+    pv_fcff = pd.Series(pv, index=year_index)
+    pv_explicit = float(pv.sum())
+
+    tv, pv_tv, ev, equity, pps = (
+        float(x) for x in _value_from_core(a, pv_explicit, fcff[-1], ebitda[-1], wacc, a.terminal_growth_rate, n)
+    )
 
     return DCFResult(
         scenario_name=a.scenario_name,
@@ -267,6 +292,42 @@ def run_dcf(
     )
 
 
+def _discount_factors(wacc, t):
+    """1 / (1 + wacc) ** t as exp(-t * log1p(wacc)), broadcasting wacc against t."""
+    return np.exp(-np.log1p(wacc) * t)
+
+
+def _value_from_core(
+    a: DCFAssumptions,
+    pv_explicit,
+    last_fcff,
+    last_ebitda,
+    wacc,
+    growth_rate,
+    n: int,
+) -> tuple[np.ndarray, ...]:
+    """Terminal value through price per share from the explicit-forecast outputs.
+
+    Inputs broadcast elementwise, so scalars, (S,) batches and (W, G) grids
+    all go through the same bridge. Returns (tv, pv_tv, ev, equity, pps).
+    """
+    spread = np.subtract(wacc, growth_rate)
+    if a.terminal_method == "exit_multiple":
+        tv = np.multiply(last_ebitda, a.exit_multiple) * np.ones_like(spread)
+    else:
+        # Perpetuity growth; zero when WACC does not exceed g
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tv = np.where(spread > 0, np.multiply(last_fcff, 1.0 + np.asarray(growth_rate)) / spread, 0.0)
+
+    # Discount TV to present (end of last forecast year)
+    pv_tv = tv * _discount_factors(wacc, n)
+
+    ev = pv_explicit + pv_tv
+    equity = ev - a.net_debt - a.preferred_equity - a.minority_interest + a.other_adjustments
+    pps = equity / a.diluted_shares if a.diluted_shares > 0 else np.zeros_like(equity)
+    return tv, pv_tv, ev, equity, pps
+
+
 # ---------------------------------------------------------------------------
 # Sensitivity grid
 # ---------------------------------------------------------------------------
@@ -290,18 +351,23 @@ def run_sensitivity(
         g = base_assumptions.terminal_growth_rate
         growth_range = [g - 0.01, g - 0.005, g, g + 0.005, g + 0.01]
 
-    grid: dict[float, dict[float, float]] = {}
-    for w in wacc_range:
-        grid[w] = {}
-        for g in growth_range:
-            a = copy.deepcopy(base_assumptions)
-            a.wacc = w
-            a.use_computed_wacc = False
-            a.terminal_growth_rate = g
-            result = run_dcf(std, a, magnitude)
-            grid[w][g] = result.price_per_share
-
-    df = pd.DataFrame(grid).T
+    a = base_assumptions
+    waccs = np.asarray(wacc_range, dtype=float)[:, None]
+    growths = np.asarray(growth_range, dtype=float)[None, :]
+    pps = np.zeros((waccs.shape[0], growths.shape[1]))
+
+    # The explicit forecast does not depend on WACC or g — run the core once.
+    # Without shares every cell is zero, so skip the forecast altogether.
+    d = a.driver_arrays()
+    if d.years and a.diluted_shares > 0:
+        out = _dcf_core(_base_revenue(std, magnitude), *d.ordered(), a.effective_wacc)
+        ebitda, fcff = out[1], out[8]
+        n = len(d.years)
+        t = np.arange(n) + 0.5  # mid-year
+        pv_explicit = (_discount_factors(waccs, t) @ fcff)[:, None]
+        pps = _value_from_core(a, pv_explicit, fcff[-1], ebitda[-1], waccs, growths, n)[-1]
+
+    df = pd.DataFrame(pps, index=list(wacc_range), columns=list(growth_range))
     df.index.name = "WACC"
     df.columns.name = "Terminal Growth"
     return df
@@ -333,39 +399,70 @@ def run_tornado(
     Returns list of dicts with keys:
         variable, label, base, low, high, low_value, high_value
     """
-    base_result = run_dcf(std, base_assumptions, magnitude)
-    base_pps = base_result.price_per_share
-
-    results = []
-    for attr, label, shock in _TORNADO_VARIABLES:
-        a_low = copy.deepcopy(base_assumptions)
-        a_high = copy.deepcopy(base_assumptions)
-
-        if attr in ("wacc", "terminal_growth_rate"):
-            # Scalar attributes
-            base_val = getattr(base_assumptions, attr)
-            setattr(a_low, attr, base_val - shock)
-            setattr(a_high, attr, base_val + shock)
+    a = base_assumptions
+    d = a.driver_arrays()
+    n = len(d.years)
+    n_vars = len(_TORNADO_VARIABLES)
+
+    if n and a.diluted_shares > 0:
+        # One base forecast; row 0 of the batch is the base case and rows
+        # 2k+1 / 2k+2 the low / high shocks of variable k
+        drivers = d.ordered()
+        base_revenue = _base_revenue(std, magnitude)
+        revenue, ebitda, da, ebit, _, _, capex, dnwc, fcff, _ = _dcf_core(
+            base_revenue, *drivers, a.effective_wacc,
+        )
+        n_scen = 1 + 2 * n_vars
+        fcffs = np.tile(fcff, (n_scen, 1))
+        last_ebitda = np.full(n_scen, ebitda[-1])
+        wacc = np.full(n_scen, a.effective_wacc)
+        growth_rate = np.full(n_scen, a.terminal_growth_rate)
+
+        # Only revenue-growth / EBITDA-margin shocks move the revenue and EBITDA
+        # path; all of their runs go through the forecast together as one batch
+        path_vars = [(k, attr, shock) for k, (attr, _, shock) in enumerate(_TORNADO_VARIABLES)
+                     if attr in ("revenue_growth", "ebitda_margin")]
+        shocked = [np.tile(arr, (2 * len(path_vars), 1)) for arr in drivers]
+        for j, (_, attr, shock) in enumerate(path_vars):
+            shocked[DRIVER_FIELDS.index(attr)][2 * j:2 * j + 2] += np.array([[-shock], [shock]])
+        out = _forecast_vectorized(base_revenue, *shocked, 0.0)
+        path_rows = [r for k, _, _ in path_vars for r in (2 * k + 1, 2 * k + 2)]
+        fcffs[path_rows] = out[8]
+        last_ebitda[path_rows] = out[1][:, -1]
+
+        for k, (attr, _, shock) in enumerate(_TORNADO_VARIABLES):
+            rows = slice(2 * k + 1, 2 * k + 3)
+            delta = np.array([[-shock], [shock]])
             if attr == "wacc":
-                a_low.use_computed_wacc = False
-                a_high.use_computed_wacc = False
-        else:
-            # Year-by-year dict attributes
-            base_dict = getattr(base_assumptions, attr)
-            low_dict = {y: v - shock for y, v in base_dict.items()}
-            high_dict = {y: v + shock for y, v in base_dict.items()}
-            setattr(a_low, attr, low_dict)
-            setattr(a_high, attr, high_dict)
-
-        r_low = run_dcf(std, a_low, magnitude)
-        r_high = run_dcf(std, a_high, magnitude)
+                # Shock the direct WACC input (as if use_computed_wacc were off)
+                wacc[rows] = a.wacc + delta[:, 0]
+            elif attr == "terminal_growth_rate":
+                growth_rate[rows] += delta[:, 0]
+            elif attr in ("revenue_growth", "ebitda_margin"):
+                continue  # filled from the path batch above
+            elif attr in ("capex_pct_revenue", "nwc_pct_revenue"):
+                fcffs[rows] = fcff - delta * revenue
+            elif attr == "tax_rate":
+                fcffs[rows] = fcff - delta * np.maximum(ebit, 0.0)
+            else:
+                # D&A shifts EBIT, hence tax; the add-back cancels the rest
+                shocked_ebit = ebit - delta * revenue
+                fcffs[rows] = ebitda - np.maximum(shocked_ebit, 0.0) * d.tax_rate - capex - dnwc
+        t = np.arange(n) + 0.5  # mid-year
+        pv_explicit = np.einsum("ij,ij->i", fcffs, _discount_factors(wacc[:, None], t))
+        pps = _value_from_core(a, pv_explicit, fcffs[:, -1], last_ebitda, wacc, growth_rate, n)[-1]
+    else:
+        pps = np.zeros(1 + 2 * n_vars)
 
+    base_pps = float(pps[0])
+    results = []
+    for k, (attr, label, shock) in enumerate(_TORNADO_VARIABLES):
         results.append({
             "variable": attr,
             "label": label,
             "base": base_pps,
-            "low": r_low.price_per_share,
-            "high": r_high.price_per_share,
+            "low": float(pps[2 * k + 1]),
+            "high": float(pps[2 * k + 2]),
             "low_shock": -shock,
             "high_shock": shock,
         })
@@ -9,7 +9,21 @@ import numpy as np
 import pandas as pd
 
 from .models import RawSheet, RawWorkbook
-from .utils import clean_number, extract_year, detect_estimate, detect_magnitude
+from .utils import clean_number_column, detect_magnitude, parse_year_header
+
+try:
+    import python_calamine  # noqa: F401 — backs pandas' "calamine" engine
+    _EXCEL_ENGINE = "calamine"
+except ImportError:
+    # python-calamine is optional — openpyxl reads the same cells, just slower
+    _EXCEL_ENGINE = "openpyxl"
+
+try:
+    import pyarrow  # noqa: F401 — backs the Arrow string dtype for row labels
+    _LABEL_DTYPE = pd.StringDtype("pyarrow")
+except ImportError:
+    # pyarrow is optional — labels fall back to pandas' default string dtype
+    _LABEL_DTYPE = None
 
 # ---------------------------------------------------------------------------
 # Sheet type classification
@@ -27,13 +41,18 @@ _SHEET_CLASSIFIERS: list[tuple[str, list[str]]] = [
     ("capstruct_detail", ["capital structure detail"]),
 ]
 
+# One compiled alternation per sheet type, checked in _SHEET_CLASSIFIERS order
+_SHEET_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+    (stype, re.compile("|".join(map(re.escape, keywords))))
+    for stype, keywords in _SHEET_CLASSIFIERS
+]
+
 
 def _classify_sheet(name: str) -> str:
     nl = name.lower().strip()
-    for stype, keywords in _SHEET_CLASSIFIERS:
-        for kw in keywords:
-            if kw in nl:
-                return stype
+    for stype, pattern in _SHEET_PATTERNS:
+        if pattern.search(nl):
+            return stype
     return "unknown"
 
 
@@ -41,39 +60,47 @@ def _classify_sheet(name: str) -> str:
 # Header / metadata detection
 # ---------------------------------------------------------------------------
 
-_YEAR_RE = re.compile(r"((?:19|20)\d{2})")
+_YEAR_RE = re.compile(r"(?:19|20)\d{2}", re.ASCII)  # non-capturing: only presence is tested
 
 
 def _find_header_row(df: pd.DataFrame, max_scan: int = 20) -> int | None:
     """Scan rows for one containing >=3 year-like tokens."""
-    for idx in range(min(max_scan, len(df))):
-        row = df.iloc[idx]
-        year_count = sum(1 for v in row if _YEAR_RE.search(str(v)))
-        if year_count >= 3:
-            return idx
-    return None
+    scan = df.head(max_scan).astype(str)
+    if scan.empty:
+        return None
+    counts = scan.apply(lambda col: col.str.contains(_YEAR_RE, na=False)).sum(axis=1).to_numpy()
+    idx = int(np.argmax(counts >= 3))
+    return idx if counts[idx] >= 3 else None
+
+
+# Metadata keywords, found in one pass over each lowercased row
+_META_RE = re.compile(
+    r"(?P<currency>currency)|(?P<magnitude>magnitude)"
+    r"|(?P<scale>thousand|million|billion)|(?P<code>usd|eur|gbp)"
+)
 
 
 def _extract_metadata(df: pd.DataFrame) -> dict[str, Any]:
     """Extract company name, currency, and magnitude from top metadata rows."""
     meta: dict[str, Any] = {"company_name": "", "currency": "USD", "magnitude": "thousands"}
-    for idx in range(min(15, len(df))):
-        row_text = " ".join(str(v) for v in df.iloc[idx] if v is not None and str(v).strip())
-        rt = row_text.lower()
+    for idx, row in enumerate(df.iloc[:15].to_numpy()):
+        # Blank cells read back as NaN; leave them out of the row text
+        row_text = " ".join(str(v) for v in row if pd.notna(v) and str(v).strip())
+        hits: dict[str, set[str]] = {}
+        for m in _META_RE.finditer(row_text.lower()):
+            hits.setdefault(m.lastgroup, set()).add(m.group())
         # Company name is usually in the first few rows
-        if idx <= 3 and row_text.strip() and "currency" not in rt and "magnitude" not in rt:
+        if idx <= 3 and row_text.strip() and "currency" not in hits and "magnitude" not in hits:
             if not meta["company_name"]:
                 meta["company_name"] = row_text.strip()
         # Currency
-        if "currency" in rt:
-            if "usd" in rt:
-                meta["currency"] = "USD"
-            elif "eur" in rt:
-                meta["currency"] = "EUR"
-            elif "gbp" in rt:
-                meta["currency"] = "GBP"
+        if "currency" in hits:
+            codes = hits.get("code", set())
+            currency = next((c for c in ("usd", "eur", "gbp") if c in codes), None)
+            if currency:
+                meta["currency"] = currency.upper()
         # Magnitude
-        if "magnitude" in rt or "thousand" in rt or "million" in rt or "billion" in rt:
+        if "magnitude" in hits or "scale" in hits:
             meta["magnitude"] = detect_magnitude(row_text)
     return meta
 
@@ -90,7 +117,8 @@ def _parse_sheet(name: str, df_raw: pd.DataFrame) -> RawSheet:
     # Find the header row
     header_idx = _find_header_row(df_raw)
 
-    raw_table = df_raw.copy()
+    # Nothing below writes to df_raw, so the sheet keeps it as-is rather than a copy
+    raw_table = df_raw
 
     if header_idx is None:
         # Could not find year headers — store raw only
@@ -113,11 +141,11 @@ def _parse_sheet(name: str, df_raw: pd.DataFrame) -> RawSheet:
     year_cols: dict[int, int] = {}  # col_idx → year
     year_meta: dict[int, dict[str, Any]] = {}
     for col_idx, val in enumerate(header_row):
-        yr = extract_year(val)
+        yr, is_estimate = parse_year_header(val)
         if yr is not None and yr not in year_cols.values():
             year_cols[col_idx] = yr
             year_meta[yr] = {
-                "is_estimate": detect_estimate(val),
+                "is_estimate": is_estimate,
                 "raw_header": str(val),
             }
 
@@ -136,37 +164,39 @@ def _parse_sheet(name: str, df_raw: pd.DataFrame) -> RawSheet:
 
     years = sorted(year_cols.values())
 
+    # Work on the raw ndarray from here on — no per-cell .iloc dispatch
+    arr = df_raw.to_numpy()
+    body = arr[header_idx + 1:]
+
     # Find the label column (first column with non-empty text below header)
     label_col = 0
-    for col_idx in range(min(3, df_raw.shape[1])):
-        non_empty = 0
-        for row_idx in range(header_idx + 1, min(header_idx + 10, len(df_raw))):
-            v = df_raw.iloc[row_idx, col_idx]
-            if v is not None and str(v).strip():
-                non_empty += 1
+    for col_idx in range(min(3, arr.shape[1])):
+        non_empty = sum(1 for v in body[:9, col_idx] if v is not None and str(v).strip())
         if non_empty >= 2:
             label_col = col_idx
             break
 
-    # Build the statement DataFrame
-    data_rows = []
-    for row_idx in range(header_idx + 1, len(df_raw)):
-        label = df_raw.iloc[row_idx, label_col]
-        if label is None or str(label).strip() == "":
-            continue
-        label_str = str(label).strip().strip("'\"")
-        row_data = {"row_label": label_str}
-        for col_idx, yr in year_cols.items():
-            raw_val = df_raw.iloc[row_idx, col_idx]
-            row_data[yr] = clean_number(raw_val)
-        data_rows.append(row_data)
-
-    if data_rows:
-        stmt_df = pd.DataFrame(data_rows)
-        stmt_df = stmt_df.set_index("row_label")
-        # Sort columns
-        int_cols = sorted([c for c in stmt_df.columns if isinstance(c, int)])
-        stmt_df = stmt_df[int_cols]
+    # Row labels in bulk: trim whitespace, then quotes; rows with a blank or
+    # missing label (None/NaN) are dropped
+    label_cells = body[:, label_col]
+    label_text = np.char.strip(np.char.strip(label_cells.astype(str)), "'\"")
+    keep = (label_text != "") & ~pd.isna(label_cells)
+
+    # Build the statement DataFrame column by column
+    if keep.any():
+        labels = pd.Index(label_text[keep], dtype=_LABEL_DTYPE, name="row_label")
+        ordered = sorted(year_cols.items(), key=lambda kv: kv[1])
+        year_idx = np.fromiter((col_idx for col_idx, _ in ordered), dtype=np.intp, count=len(ordered))
+        # Gather just the kept rows × year columns in one 2-D take
+        cells = body[np.ix_(keep, year_idx)]
+        # Stack the cleaned year columns as rows and hand pandas the transpose:
+        # its 2-D block is stored column-major, so each year stays contiguous
+        stmt_df = pd.DataFrame(
+            np.vstack([clean_number_column(col) for col in cells.T]).T,
+            index=labels,
+            columns=[yr for _, yr in ordered],
+            copy=False,
+        )
     else:
         stmt_df = pd.DataFrame()
 
@@ -193,12 +223,15 @@ def parse_workbook(file) -> RawWorkbook:
     Args:
         file: file-like object or path to .xlsx
     """
-    xls = pd.ExcelFile(file, engine="openpyxl")
     wb = RawWorkbook(file_name=getattr(file, "name", str(file)))
 
-    for sheet_name in xls.sheet_names:
-        df_raw = xls.parse(sheet_name, header=None)
-        sheet = _parse_sheet(sheet_name, df_raw)
-        wb.sheets[sheet_name] = sheet
+    # Rust-backed calamine when available, else openpyxl (read-only); the
+    # context manager releases the workbook/file handle once all sheets are read.
+    with pd.ExcelFile(file, engine=_EXCEL_ENGINE) as xls:
+        # Decode every sheet while the file is open; parsing runs after it closes
+        raw = {name: xls.parse(name, header=None) for name in xls.sheet_names}
+
+    for name, df in raw.items():
+        wb.sheets[name] = _parse_sheet(name, df)
 
     return wb
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 
 from .models import (
     MappingEntry, MappingReport, RawWorkbook, StandardizedFinancials,
 )
-from .utils import fuzzy_match, normalize_label, clean_number
+from .utils import fuzzy_score_matrix, normalize_label, clean_number
 
 # ---------------------------------------------------------------------------
 # Canonical field dictionaries — key = canonical name, value = list of aliases
@@ -60,6 +62,14 @@ MULTIPLES_FIELDS: dict[str, list[str]] = {
     "Enterprise Value": ["total enterprise value", "enterprise value", "tev"],
 }
 
+# Field dictionaries by section, so cached mapping runs can key on a plain string
+_FIELD_DICTS: dict[str, dict[str, list[str]]] = {
+    "income": INCOME_STATEMENT_FIELDS,
+    "balance": BALANCE_SHEET_FIELDS,
+    "cashflow": CASH_FLOW_FIELDS,
+    "multiples": MULTIPLES_FIELDS,
+}
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -73,27 +83,96 @@ def _find_sheet_by_type(wb: RawWorkbook, sheet_type: str) -> str | None:
     return None
 
 
+def _section_aliases(section: str) -> tuple[list[str], list[list[int]]]:
+    """A section's distinct normalized aliases, plus each field's rows into that list.
+
+    Aliases repeat across fields and collapse under normalization
+    ("Revenue" / "revenue"), so each distinct string is scored only once.
+    """
+    unique: dict[str, int] = {}
+    field_rows = []
+    for canonical, aliases in _FIELD_DICTS[section].items():
+        rows = []
+        for alias in [canonical] + aliases:
+            row = unique.setdefault(normalize_label(alias), len(unique))
+            if row not in rows:
+                rows.append(row)
+        field_rows.append(rows)
+    return list(unique), field_rows
+
+
+# Alias tables are static, so normalize them once at import
+_SECTION_ALIASES = {section: _section_aliases(section) for section in _FIELD_DICTS}
+
+
+# Best fuzzy score a field needs before it is mapped at all
+_MATCH_FLOOR = 0.50
+
+
+@lru_cache(maxsize=32)
+def _best_matches(section: str, raw_labels: tuple[str, ...]) -> tuple[MappingEntry, ...]:
+    """Best raw label and score per field of a section — the fuzzy work behind _map_fields.
+
+    MappingEntry is frozen, so the cached entries are shared between callers as-is.
+    """
+    field_dict = _FIELD_DICTS[section]
+    if not raw_labels:
+        return tuple(MappingEntry(canonical, "", 0.0) for canonical in field_dict)
+
+    norm_aliases, field_rows = _SECTION_ALIASES[section]
+    norm_labels = [normalize_label(l) for l in raw_labels]
+
+    # A label identical to one of a field's aliases scores 1.0, the maximum,
+    # so those fields take their first exact hit and skip fuzzy scoring
+    label_pos: dict[str, int] = {}
+    for j, label in enumerate(norm_labels):
+        label_pos.setdefault(label, j)
+    exact = {}
+    for f, rows in enumerate(field_rows):
+        hit = next((label_pos[norm_aliases[r]] for r in rows if norm_aliases[r] in label_pos), None)
+        if hit is not None:
+            exact[f] = hit
+
+    # Score the aliases of the remaining fields against every distinct label in
+    # one batch; label_pos keeps first-appearance order, so ties still go to the
+    # earliest raw row
+    pending = sorted({r for f, rows in enumerate(field_rows) if f not in exact for r in rows})
+    if pending:
+        first_rows = list(label_pos.values())
+        scores = fuzzy_score_matrix([norm_aliases[r] for r in pending], list(label_pos), _MATCH_FLOOR)
+        score_row = {r: k for k, r in enumerate(pending)}
+
+    matches = []
+    for f, (canonical, rows) in enumerate(zip(field_dict, field_rows)):
+        if f in exact:
+            matches.append(MappingEntry(canonical, raw_labels[exact[f]], 1.0))
+            continue
+        block = scores[[score_row[r] for r in rows]]
+        # First best (alias, label) pair wins ties, as in a sequential scan
+        i, j = np.unravel_index(block.argmax(), block.shape)
+        best_score = float(block[i, j])
+        if best_score >= _MATCH_FLOOR:
+            matches.append(MappingEntry(canonical, raw_labels[first_rows[j]], best_score))
+        else:
+            matches.append(MappingEntry(canonical, "", 0.0))
+    return tuple(matches)
+
+
 def _map_fields(
-    field_dict: dict[str, list[str]],
+    section: str,
     raw_labels: list[str],
     threshold: float = 0.80,
 ) -> list[MappingEntry]:
-    """Map canonical fields to raw labels via fuzzy matching."""
-    entries: list[MappingEntry] = []
-    for canonical, aliases in field_dict.items():
-        best_raw = ""
-        best_score = 0.0
-        # Try each alias, keep the best overall match
-        for alias in [canonical] + aliases:
-            match, score = fuzzy_match(alias, raw_labels, threshold=0.50)
-            if score > best_score:
-                best_raw, best_score = match, score
-        entries.append(MappingEntry(
-            canonical=canonical,
-            raw_match=best_raw,
-            confidence=best_score,
-        ))
-    return entries
+    """Map canonical fields to raw labels via fuzzy matching (memoized per section and labels)."""
+    return list(_best_matches(section, tuple(raw_labels)))
+
+
+def _first_positions(labels: pd.Index) -> dict:
+    """Label → position of its first occurrence."""
+    positions: dict = {}
+    for i, label in enumerate(labels):
+        positions.setdefault(label, i)
+    return positions
 
 
 def _build_canonical_df(
@@ -116,20 +195,21 @@ def _build_canonical_df(
 
     available_cols = [y for y in use_years if y in statement_df.columns]
 
-    rows: dict[str, list[float | None]] = {}
-    for m in mappings:
-        resolved = m.resolved
-        if resolved and resolved in statement_df.index:
-            vals = [statement_df.at[resolved, y] if y in statement_df.columns else None
-                    for y in available_cols]
-            rows[m.canonical] = vals
-        else:
-            rows[m.canonical] = [None] * len(available_cols)
-
-    df = pd.DataFrame(rows, index=available_cols).T
-    df.columns = available_cols
-    df.index.name = "Line Item"
-    return df
+    # Resolve labels/years to positions once, then gather the block from the
+    # ndarray. Repeated labels keep their first occurrence; unmatched fields
+    # come back as NaN rows.
+    label_pos = _first_positions(statement_df.index)
+    col_pos = _first_positions(statement_df.columns)
+    rows = np.array([label_pos.get(m.resolved, -1) for m in mappings], dtype=np.intp)
+    cols = np.array([col_pos[y] for y in available_cols], dtype=np.intp)
+    block = statement_df.to_numpy(dtype=float)[rows[:, None], cols]
+    block[rows < 0] = np.nan
+    return pd.DataFrame(
+        block,
+        index=pd.Index([m.canonical for m in mappings], name="Line Item"),
+        columns=available_cols,
+        copy=False,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -151,23 +231,17 @@ def _map_multiples(
         return [], pd.DataFrame(), None
 
     raw_labels = list(stmt.index)
-    mappings = _map_fields(MULTIPLES_FIELDS, raw_labels, threshold)
+    mappings = _map_fields("multiples", raw_labels, threshold)
 
     # For multiples, build a simplified canonical df
     canonical_df = _build_canonical_df(stmt, mappings, sheet.years, True, sheet.year_metadata)
 
-    # Try to extract exit multiple from EV/EBITDA
+    # Exit multiple suggestion: most recent EV/EBITDA, read off the gathered block
     exit_multiple: float | None = None
-    ev_ebitda_entry = next((m for m in mappings if m.canonical == "EV/EBITDA"), None)
-    if ev_ebitda_entry and ev_ebitda_entry.resolved and ev_ebitda_entry.resolved in stmt.index:
-        # Get the most recent value
-        row = stmt.loc[ev_ebitda_entry.resolved]
-        for yr in sorted(sheet.years, reverse=True):
-            if yr in row.index:
-                val = row[yr]
-                if val is not None and not (isinstance(val, float) and np.isnan(val)):
-                    exit_multiple = float(val)
-                    break
+    if "EV/EBITDA" in canonical_df.index:
+        row = canonical_df.loc["EV/EBITDA"].dropna()
+        if not row.empty:
+            exit_multiple = float(row.iloc[-1])
 
     return mappings, canonical_df, exit_multiple
 
@@ -196,7 +270,7 @@ def build_standardized(
         sheet = wb.sheets[is_name]
         if sheet.statement_df is not None and not sheet.statement_df.empty:
             raw_labels = list(sheet.statement_df.index)
-            report.income_statement = _map_fields(INCOME_STATEMENT_FIELDS, raw_labels, threshold)
+            report.income_statement = _map_fields("income", raw_labels, threshold)
             std.income_statement = _build_canonical_df(
                 sheet.statement_df, report.income_statement,
                 sheet.years, include_estimates, sheet.year_metadata,
@@ -208,7 +282,7 @@ def build_standardized(
         sheet = wb.sheets[bs_name]
         if sheet.statement_df is not None and not sheet.statement_df.empty:
             raw_labels = list(sheet.statement_df.index)
-            report.balance_sheet = _map_fields(BALANCE_SHEET_FIELDS, raw_labels, threshold)
+            report.balance_sheet = _map_fields("balance", raw_labels, threshold)
             std.balance_sheet = _build_canonical_df(
                 sheet.statement_df, report.balance_sheet,
                 sheet.years, include_estimates, sheet.year_metadata,
@@ -220,12 +294,14 @@ def build_standardized(
         sheet = wb.sheets[cf_name]
         if sheet.statement_df is not None and not sheet.statement_df.empty:
             raw_labels = list(sheet.statement_df.index)
-            report.cash_flow = _map_fields(CASH_FLOW_FIELDS, raw_labels, threshold)
+            report.cash_flow = _map_fields("cashflow", raw_labels, threshold)
             std.cash_flow = _build_canonical_df(
                 sheet.statement_df, report.cash_flow,
                 sheet.years, include_estimates, sheet.year_metadata,
             )
 
+    std.years = tuple(sorted(int(c) for c in std.income_statement.columns))
+
     # Multiples
     mult_mappings, mult_df, exit_multiple = _map_multiples(wb, threshold)
     report.multiples = mult_mappings
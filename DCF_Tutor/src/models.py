@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
+from functools import cached_property
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -12,7 +14,7 @@ import pandas as pd
 # Raw import models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class RawSheet:
     """One sheet from the uploaded workbook."""
     name: str
@@ -32,12 +34,17 @@ class RawWorkbook:
     sheets: dict[str, RawSheet] = field(default_factory=dict)
     file_name: str = ""
 
+    @cached_property
+    def first_sheet(self) -> RawSheet | None:
+        """First sheet in workbook order (computed on first access, after parsing)."""
+        return next(iter(self.sheets.values()), None)
+
 
 # ---------------------------------------------------------------------------
 # Mapping models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MappingEntry:
     """One canonical-field → raw-label mapping."""
     canonical: str
@@ -66,15 +73,63 @@ class StandardizedFinancials:
     balance_sheet: pd.DataFrame = field(default_factory=pd.DataFrame)
     cash_flow: pd.DataFrame = field(default_factory=pd.DataFrame)
     multiples: pd.DataFrame = field(default_factory=pd.DataFrame)
+    years: tuple[int, ...] = ()      # sorted income-statement years
 
 
 # ---------------------------------------------------------------------------
 # DCF models
 # ---------------------------------------------------------------------------
 
+# Year-by-year driver fields on DCFAssumptions (dict keyed by forecast year)
+DRIVER_FIELDS: tuple[str, ...] = (
+    "revenue_growth",
+    "ebitda_margin",
+    "da_pct_revenue",
+    "tax_rate",
+    "capex_pct_revenue",
+    "nwc_pct_revenue",
+)
+
+# Value used for a forecast year that a driver dict has no entry for
+DRIVER_DEFAULTS: dict[str, float] = {
+    "revenue_growth": 0.05,
+    "ebitda_margin": 0.20,
+    "da_pct_revenue": 0.03,
+    "tax_rate": 0.21,
+    "capex_pct_revenue": 0.05,
+    "nwc_pct_revenue": 0.02,
+}
+
+
+@dataclass(frozen=True)
+class DriverArrays:
+    """Per-year drivers as parallel float arrays aligned with ``years``."""
+    years: tuple[int, ...]
+    revenue_growth: np.ndarray
+    ebitda_margin: np.ndarray
+    da_pct_revenue: np.ndarray
+    tax_rate: np.ndarray
+    capex_pct_revenue: np.ndarray
+    nwc_pct_revenue: np.ndarray
+
+    def ordered(self) -> tuple[np.ndarray, ...]:
+        """The driver arrays in DRIVER_FIELDS order."""
+        return tuple(getattr(self, f) for f in DRIVER_FIELDS)
+
+
+# Inputs of DCFAssumptions.computed_wacc; assigning any of them drops the cached value
+_WACC_INPUTS = frozenset({
+    "risk_free_rate", "equity_risk_premium", "beta", "size_premium",
+    "country_risk_premium", "pre_tax_cost_of_debt", "target_debt_weight", "wacc_tax_rate",
+})
+
+
 @dataclass
 class DCFAssumptions:
-    """Year-by-year assumptions for a single scenario."""
+    """Year-by-year assumptions for a single scenario.
+
+    Not slotted: computed_wacc is a cached_property, which needs ``__dict__``.
+    """
     scenario_name: str = "Base"
     forecast_years: int = 5
 
@@ -110,6 +165,37 @@ class DCFAssumptions:
     other_adjustments: float = 0.0
     diluted_shares: float = 1.0            # in millions
 
+    def clone(self) -> DCFAssumptions:
+        """Copy with fresh per-year dicts; all other fields are immutable scalars."""
+        return replace(self, **{f: dict(getattr(self, f)) for f in DRIVER_FIELDS})
+
+    def driver_arrays(self) -> DriverArrays:
+        """Array view of the per-year drivers over the years in revenue_growth."""
+        years = tuple(sorted(self.revenue_growth))
+        n = len(years)
+        return DriverArrays(years, **{
+            f: np.fromiter((getattr(self, f).get(y, DRIVER_DEFAULTS[f]) for y in years), dtype=float, count=n)
+            for f in DRIVER_FIELDS
+        })
+
+    def set_drivers(self, drivers: DriverArrays) -> None:
+        """Replace the per-year dicts from dense arrays (inverse of driver_arrays)."""
+        for f, values in zip(DRIVER_FIELDS, drivers.ordered()):
+            setattr(self, f, dict(zip(drivers.years, values.tolist())))
+
+    def cache_key(self) -> tuple:
+        """Hashable snapshot of every input, for memoizing valuation runs."""
+        return tuple(
+            tuple(sorted(v.items())) if isinstance(v, dict) else v
+            for v in (getattr(self, f.name) for f in fields(self))
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # The app edits assumptions in place across reruns, so the cache must not go stale
+        object.__setattr__(self, name, value)
+        if name in _WACC_INPUTS:
+            self.__dict__.pop("computed_wacc", None)
+
     @property
     def target_equity_weight(self) -> float:
         return 1.0 - self.target_debt_weight
@@ -125,7 +211,7 @@ class DCFAssumptions:
     def after_tax_cost_of_debt(self) -> float:
         return self.pre_tax_cost_of_debt * (1.0 - self.wacc_tax_rate)
 
-    @property
+    @cached_property
     def computed_wacc(self) -> float:
         we = self.target_equity_weight
         wd = self.target_debt_weight
@@ -136,7 +222,7 @@ class DCFAssumptions:
         return self.computed_wacc if self.use_computed_wacc else self.wacc
 
 
-@dataclass
+@dataclass(slots=True)
 class DCFResult:
     """Output of a DCF run."""
     scenario_name: str = "Base"
@@ -145,7 +231,7 @@ class DCFResult:
     forecast_table: pd.DataFrame = field(default_factory=pd.DataFrame)
 
     # Present values
-    pv_fcff: dict[int, float] = field(default_factory=dict)   # year → PV of FCFF
+    pv_fcff: pd.Series = field(default_factory=lambda: pd.Series(dtype=float))  # year → PV of FCFF
     terminal_value: float = 0.0
     pv_terminal: float = 0.0
     pv_explicit: float = 0.0
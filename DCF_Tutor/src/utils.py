@@ -4,15 +4,33 @@ from __future__ import annotations
 
 import math
 import re
+from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
+import pandas as pd
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    # rapidfuzz is optional — a numba kernel (or difflib) scores the same pairs, just slower
+    fuzz = process = None
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional — it only speeds up the no-rapidfuzz fallback
+    njit = None
 
 
 # ---------------------------------------------------------------------------
 # Number parsing
 # ---------------------------------------------------------------------------
 
+_NA_STRINGS = frozenset({"NA", "N/A", "NM", "N.M.", "--", "-", ""})
+
+
 def clean_number(value: Any) -> float | None:
     """Convert a cell value to float. Returns None for missing/non-meaningful."""
     if value is None:
@@ -22,41 +40,90 @@ def clean_number(value: Any) -> float | None:
             return None
         return float(value)
     s = str(value).strip().strip("'\"")
-    if s.upper() in ("NA", "N/A", "NM", "N.M.", "--", "-", ""):
+    if s.upper() in _NA_STRINGS:
         return None
     # Handle parentheses for negatives: (123) → -123
-    neg = False
+    sign = 1.0
     if s.startswith("(") and s.endswith(")"):
-        neg = True
-        s = s[1:-1]
-    # Strip currency symbols and commas
-    s = re.sub(r"[$€£¥,]", "", s)
-    # Strip trailing % but keep value
-    pct = False
-    if s.endswith("%"):
-        pct = True
-        s = s[:-1]
-    s = s.strip()
+        sign, s = -1.0, s[1:-1]
+    # Strip currency symbols/commas and a trailing % (value kept as-is; caller handles %).
+    # Chained str.replace beats both re.sub and str.translate, whose deletion
+    # table falls off its fast path on the non-ASCII currency signs.
+    s = s.replace(",", "").replace("$", "")
+    if not s.isascii():
+        s = s.replace("€", "").replace("£", "").replace("¥", "")
+    s = s.removesuffix("%").strip()
     try:
-        val = float(s)
+        return sign * float(s)
     except (ValueError, TypeError):
         return None
-    if neg:
-        val = -val
-    if pct:
-        val = val  # keep as-is; caller handles % interpretation
-    return val
+
+
+@lru_cache(maxsize=4096)
+def _clean_text(value: str) -> float:
+    # Export text cells repeat heavily ("NM", "--", "(1.0)"), so parse each once
+    val = clean_number(value)
+    return math.nan if val is None else val
+
+
+def _clean_cell(value: Any) -> float:
+    if type(value) is float and math.isfinite(value):
+        return value
+    if type(value) is str:
+        return _clean_text(value)
+    val = clean_number(value)
+    return math.nan if val is None else val
+
+
+def clean_number_array(values: Any) -> np.ndarray:
+    """clean_number over a whole array; missing/unparseable cells become NaN.
+
+    Finite floats — the bulk of any export — pass straight through and text
+    cells go through a memoized clean_number.
+    """
+    arr = np.asarray(values, dtype=object)
+    out = np.fromiter(map(_clean_cell, arr.ravel().tolist()), dtype=float, count=arr.size)
+    return out.reshape(arr.shape)
+
+
+# infer_dtype results for columns that hold only numbers (NaN included)
+_NUMERIC_INFERRED = frozenset({"floating", "integer", "mixed-integer-float"})
+
+
+def clean_number_column(col: np.ndarray) -> np.ndarray:
+    """clean_number_array for one column, skipping the per-cell pass when it is already numeric."""
+    if col.dtype.kind in "fiu" or pd.api.types.infer_dtype(col, skipna=False) in _NUMERIC_INFERRED:
+        out = col.astype(float)
+        out[~np.isfinite(out)] = np.nan
+        return out
+    return clean_number_array(col)
 
 
 # ---------------------------------------------------------------------------
 # Label normalization
 # ---------------------------------------------------------------------------
 
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+# The ASCII characters _PUNCT_RE removes, for bytes.translate on the ASCII fast
+# path (str.translate walks a dict per character and is slower than the regex)
+_ASCII_PUNCT = bytes(c for c in range(128) if _PUNCT_RE.match(chr(c)))
+
+
+@lru_cache(maxsize=4096, typed=True)
 def normalize_label(label: str) -> str:
-    """Lowercase, strip whitespace/punctuation for comparison."""
-    s = str(label).strip()
-    s = re.sub(r"[^\w\s]", "", s)  # remove punctuation
-    s = re.sub(r"\s+", " ", s).strip().lower()
+    """Lowercase, strip whitespace/punctuation for comparison.
+
+    Memoized: sheets and alias tables repeat the same labels.  typed=True
+    keeps e.g. 1 and 1.0 apart, since they hash alike but print differently.
+    """
+    s = str(label)
+    if s.isascii():
+        # split() trims and collapses exactly the whitespace \s matches
+        return " ".join(s.encode("ascii").translate(None, _ASCII_PUNCT).decode("ascii").split()).lower()
+    s = s.strip()
+    s = _PUNCT_RE.sub("", s)  # remove punctuation
+    s = _SPACE_RE.sub(" ", s).strip().lower()
     return s
 
 
@@ -69,79 +136,219 @@ def fuzzy_match(query: str, candidates: list[str], threshold: float = 0.60) -> t
 
     Score is 0-1.  Returns ("", 0.0) if no candidate meets threshold.
     """
-    nq = normalize_label(query)
-    if not nq or not candidates:
+    idx, score = fuzzy_match_norm(
+        normalize_label(query), [normalize_label(c) for c in candidates], threshold,
+    )
+    if idx < 0:
         return ("", 0.0)
+    return (candidates[idx], score)
 
-    try:
-        from rapidfuzz import fuzz
-        best, best_score = "", 0.0
-        for c in candidates:
-            nc = normalize_label(c)
-            score = fuzz.token_sort_ratio(nq, nc) / 100.0
-            if score > best_score:
-                best, best_score = c, score
-        if best_score >= threshold:
-            return (best, best_score)
-        return ("", 0.0)
-    except ImportError:
-        pass
 
-    # difflib fallback
-    from difflib import SequenceMatcher
-    best, best_score = "", 0.0
-    for c in candidates:
-        nc = normalize_label(c)
-        score = SequenceMatcher(None, nq, nc).ratio()
+def fuzzy_match_norm(
+    norm_query: str, norm_candidates: list[str], threshold: float = 0.60,
+) -> tuple[int, float]:
+    """fuzzy_match on already-normalized strings; returns (index, score).
+
+    Index is -1 if no candidate meets threshold.  Lets callers normalize a
+    label list once and match many queries against it.
+    """
+    if not norm_query or not norm_candidates:
+        return (-1, 0.0)
+
+    # Well-formed workbooks mostly hit a candidate verbatim; skip the scorer then
+    if norm_query in norm_candidates:
+        return (norm_candidates.index(norm_query), 1.0)
+
+    if process is not None:
+        # The whole scan runs in C++, pruning candidates below the cutoff
+        hit = process.extractOne(
+            norm_query, norm_candidates, scorer=fuzz.token_sort_ratio, score_cutoff=threshold * 100,
+        )
+        if hit is None or hit[1] <= 0:
+            return (-1, 0.0)
+        return (hit[2], hit[1] / 100.0)
+
+    if _indel_ratio_matrix is not None:
+        row = fuzzy_score_matrix([norm_query], norm_candidates, score_cutoff=threshold)[0]
+        best = int(row.argmax())
+        score = float(row[best])
+        if score > 0 and score >= threshold:
+            return (best, score)
+        return (-1, 0.0)
+
+    # difflib fallback; the cheap upper bounds skip candidates that cannot
+    # beat the current best or reach the threshold
+    best, best_score = -1, 0.0
+    for i, nc in enumerate(norm_candidates):
+        sm = SequenceMatcher(None, norm_query, nc)
+        floor = max(best_score, threshold)
+        if sm.real_quick_ratio() < floor or sm.quick_ratio() < floor:
+            continue
+        score = sm.ratio()
         if score > best_score:
-            best, best_score = c, score
+            best, best_score = i, score
     if best_score >= threshold:
         return (best, best_score)
-    return ("", 0.0)
+    return (-1, 0.0)
+
+
+# Matrices at least this large are scored on all cores; smaller ones finish
+# before a thread pool would pay for itself
+_PARALLEL_SCORE_CELLS = 100_000
+
+
+def fuzzy_score_matrix(
+    norm_queries: list[str], norm_candidates: list[str], score_cutoff: float = 0.0,
+) -> np.ndarray:
+    """0-1 scores of every normalized query against every normalized candidate.
+
+    Same scorer as fuzzy_match; rapidfuzz fills the whole matrix in one call.
+    Pairs that provably score below score_cutoff may be left at 0 unscored.
+    """
+    # Pruning only — callers still compare against their own threshold, so keep
+    # the bound a hair low rather than drop a pair that sits exactly on it
+    cutoff = max(score_cutoff * 100.0 - 1e-9, 0.0)
+    if process is not None:
+        big = len(norm_queries) * len(norm_candidates) >= _PARALLEL_SCORE_CELLS
+        return process.cdist(
+            norm_queries, norm_candidates, scorer=fuzz.token_sort_ratio,
+            dtype=np.float64, workers=-1 if big else 1, score_cutoff=cutoff,
+        ) / 100.0
+
+    if _indel_ratio_matrix is not None:
+        q_codes, q_off = _pack_token_sorted(norm_queries)
+        c_codes, c_off = _pack_token_sorted(norm_candidates)
+        return _indel_ratio_matrix(q_codes, q_off, c_codes, c_off, cutoff) / 100.0
+
+    # difflib fallback
+    cutoff /= 100.0
+    scores = np.zeros((len(norm_queries), len(norm_candidates)))
+    for i, q in enumerate(norm_queries):
+        for j, c in enumerate(norm_candidates):
+            sm = SequenceMatcher(None, q, c)
+            if sm.real_quick_ratio() >= cutoff and sm.quick_ratio() >= cutoff:
+                scores[i, j] = sm.ratio()
+    return scores
+
+
+def _pack_token_sorted(strings: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Token-sort each string and pack the code points into one flat array + offsets."""
+    sorted_strs = [" ".join(sorted(s.split())) for s in strings]
+    codes = np.frombuffer("".join(sorted_strs).encode("utf-32-le"), dtype=np.uint32)
+    offsets = np.zeros(len(sorted_strs) + 1, dtype=np.int64)
+    np.cumsum([len(t) for t in sorted_strs], out=offsets[1:])
+    return codes, offsets
+
+
+def _indel_ratio_loop(q_codes, q_off, c_codes, c_off, cutoff):
+    """rapidfuzz's Indel ratio (2 * LCS / total length, in percent) for every packed pair.
+
+    Pairs whose length difference alone keeps them under cutoff are left at 0.
+    """
+    nq = q_off.shape[0] - 1
+    nc = c_off.shape[0] - 1
+    out = np.zeros((nq, nc))
+    max_lb = 0
+    for j in range(nc):
+        max_lb = max(max_lb, c_off[j + 1] - c_off[j])
+    prev = np.zeros(max_lb + 1, dtype=np.int64)
+    cur = np.zeros(max_lb + 1, dtype=np.int64)
+    for i in range(nq):
+        a = q_codes[q_off[i]:q_off[i + 1]]
+        la = a.shape[0]
+        for j in range(nc):
+            b = c_codes[c_off[j]:c_off[j + 1]]
+            lb = b.shape[0]
+            if la + lb == 0:
+                out[i, j] = 100.0
+                continue
+            if (1.0 - abs(la - lb) / (la + lb)) * 100.0 < cutoff:
+                continue
+            prev[:lb + 1] = 0
+            for x in range(la):
+                cur[0] = 0
+                for k in range(1, lb + 1):
+                    if a[x] == b[k - 1]:
+                        cur[k] = prev[k - 1] + 1
+                    else:
+                        cur[k] = max(prev[k], cur[k - 1])
+                prev, cur = cur, prev
+            dist = la + lb - 2 * prev[lb]
+            out[i, j] = (1.0 - dist / (la + lb)) * 100.0
+    return out
+
+
+# Scores pairs like rapidfuzz's token_sort_ratio when rapidfuzz is missing but numba is not
+_indel_ratio_matrix = njit(cache=True)(_indel_ratio_loop) if njit is not None else None
 
 
 # ---------------------------------------------------------------------------
 # Year extraction & estimate detection
 # ---------------------------------------------------------------------------
 
-_YEAR_RE = re.compile(r"((?:19|20)\d{2})")
+_YEAR_RE = re.compile(r"((?:19|20)\d{2})", re.ASCII)  # headers are ASCII; skips Unicode class tests
 
+@lru_cache(maxsize=1024, typed=True)
 def extract_year(header: Any) -> int | None:
-    """Pull the first 4-digit year from a header string like '2020 FY'."""
+    """Pull the first 4-digit year from a header string like '2020 FY'.
+
+    Memoized like normalize_label: every statement sheet repeats the same headers.
+    """
     m = _YEAR_RE.search(str(header))
     return int(m.group(1)) if m else None
 
 
-_EST_RE = re.compile(r"(?:\d)(E)\b|(?:\b)(Est|Estimate|Proj|Projected|Forecast)\b", re.IGNORECASE)
+_EST_RE = re.compile(r"(?:\d)(E)\b|(?:\b)(Est|Estimate|Proj|Projected|Forecast)\b", re.IGNORECASE | re.ASCII)
 
+@lru_cache(maxsize=1024, typed=True)
 def detect_estimate(header: Any) -> bool:
     """Return True if a column header looks like an estimate."""
     return bool(_EST_RE.search(str(header)))
 
 
+@lru_cache(maxsize=1024, typed=True)
+def parse_year_header(header: Any) -> tuple[int | None, bool]:
+    """(year, is_estimate) for a column header; str() runs once and the estimate
+    pattern is only tried on headers that carry a year."""
+    text = str(header)
+    m = _YEAR_RE.search(text)
+    if m is None:
+        return (None, False)
+    return (int(m.group(1)), bool(_EST_RE.search(text)))
+
+
 # ---------------------------------------------------------------------------
 # Magnitude detection
 # ---------------------------------------------------------------------------
 
+_MAG_RE = re.compile(r"billion|\(b\)|million|\(mm?\)|thousand|\(k\)", re.IGNORECASE)
+_MAG_MAP = {
+    "billion": "billions", "(b)": "billions",
+    "million": "millions", "(m)": "millions", "(mm)": "millions",
+    "thousand": "thousands", "(k)": "thousands",
+}
+
+
 def detect_magnitude(text: str) -> str:
     """Detect magnitude from metadata row text. Returns 'thousands', 'millions', or 'billions'."""
-    t = str(text).lower()
-    if "billion" in t or "(b)" in t:
-        return "billions"
-    if "million" in t or "(m)" in t or "(mm)" in t:
-        return "millions"
-    if "thousand" in t or "(k)" in t:
-        return "thousands"
+    hits = {_MAG_MAP[m.lower()] for m in _MAG_RE.findall(str(text))}
+    # Larger units win when a row mentions several (e.g. "Millions (B)")
+    for mag in ("billions", "millions"):
+        if mag in hits:
+            return mag
     return "thousands"  # default for CIQ exports
 
 
+_MAGNITUDE_MULTIPLIERS: dict[str, float] = {
+    "thousands": 0.001,
+    "millions": 1.0,
+    "billions": 1000.0,
+}
+
+
 def magnitude_multiplier(mag: str) -> float:
     """Multiplier to convert from stated magnitude to millions (internal standard)."""
-    return {
-        "thousands": 0.001,
-        "millions": 1.0,
-        "billions": 1000.0,
-    }.get(mag, 0.001)
+    return _MAGNITUDE_MULTIPLIERS.get(mag, 0.001)
 
 
 # ---------------------------------------------------------------------------
@@ -160,6 +367,19 @@ def fmt_number(value: float | None, decimals: int = 1, prefix: str = "$", suffix
     return f"{prefix}{formatted}{suffix}"
 
 
+def fmt_number_array(values: Any, decimals: int = 1, prefix: str = "$", suffix: str = "") -> np.ndarray:
+    """fmt_number over a whole array in one pass; returns strings in the input's shape."""
+    arr = np.asarray(values, dtype=float)
+    spec = f",.{decimals}f"
+    text = [
+        "—" if v != v
+        else f"({prefix}{-v:{spec}}{suffix})" if v < 0
+        else f"{prefix}{abs(v):{spec}}{suffix}"  # abs: -0.0 prints as 0.0, like fmt_number
+        for v in arr.ravel().tolist()
+    ]
+    return np.array(text, dtype=object).reshape(arr.shape)
+
+
 def fmt_pct(value: float | None, decimals: int = 1) -> str:
     """Format a percentage (0.10 → '10.0%')."""
     if value is None or (isinstance(value, float) and math.isnan(value)):
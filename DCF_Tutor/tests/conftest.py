@@ -135,20 +135,27 @@ def _build_synthetic_workbook() -> io.BytesIO:
     return buf
 
 
-@pytest.fixture
-def synthetic_xlsx() -> io.BytesIO:
-    """Return a BytesIO with a synthetic CIQ Excel workbook."""
-    return _build_synthetic_workbook()
+@pytest.fixture(scope="session")
+def _raw_xlsx_bytes() -> bytes:
+    """Serialize the synthetic workbook once per test session."""
+    return _build_synthetic_workbook().getvalue()
 
 
 @pytest.fixture
-def parsed_workbook(synthetic_xlsx):
+def synthetic_xlsx(_raw_xlsx_bytes) -> io.BytesIO:
+    """Return a fresh BytesIO over the synthetic CIQ Excel workbook."""
+    return io.BytesIO(_raw_xlsx_bytes)
+
+
+# Parsed and standardized fixtures are shared across the session — tests treat them as read-only.
+@pytest.fixture(scope="session")
+def parsed_workbook(_raw_xlsx_bytes):
     """Return a parsed RawWorkbook from the synthetic fixture."""
     from src.importer import parse_workbook
-    return parse_workbook(synthetic_xlsx)
+    return parse_workbook(io.BytesIO(_raw_xlsx_bytes))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def standardized_data(parsed_workbook):
     """Return (StandardizedFinancials, MappingReport, exit_multiple_suggestion)."""
     from src.mapping import build_standardized
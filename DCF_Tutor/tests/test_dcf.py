@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import pytest
 import math
+import numpy as np
 
 from src.models import DCFAssumptions, StandardizedFinancials
 from src.dcf import run_dcf, build_default_assumptions, run_sensitivity, run_tornado
+from src.dcf import _dcf_core, _forecast_loop, _forecast_vectorized
 
 
 # ---------------------------------------------------------------------------
@@ -178,6 +180,43 @@ class TestWACC:
         # Rd_at = 0.05 * 0.75 = 0.0375
         # WACC = 0.70 * 0.112 + 0.30 * 0.0375 = 0.0784 + 0.01125 = 0.08965
         assert abs(a.computed_wacc - 0.08965) < 0.0001
+        a.beta = 1.0  # in-place edits must not leave a stale cached WACC
+        assert abs(a.computed_wacc - 0.08125) < 0.0001
+
+
+class TestForecastKernel:
+    def test_loop_matches_vectorized(self, simple_assumptions):
+        drivers = list(simple_assumptions.driver_arrays().ordered())
+        drivers[1] = np.array([0.30, -0.10, 0.02])  # exercise the negative-EBIT tax floor
+        expected = _forecast_vectorized(1000.0, *drivers, 0.10)
+        np.testing.assert_allclose(_forecast_loop(1000.0, *drivers, 0.10), expected)
+        np.testing.assert_allclose(_dcf_core(1000.0, *drivers, 0.10), expected)
+
+
+class TestCloneAssumptions:
+    def test_clone_is_independent(self, simple_assumptions):
+        clone = simple_assumptions.clone()
+        clone.revenue_growth[2025] = 0.50
+        clone.wacc = 0.20
+        assert simple_assumptions.revenue_growth[2025] == 0.10
+        assert simple_assumptions.wacc == 0.10
+
+    def test_clone_preserves_values(self, simple_assumptions):
+        assert simple_assumptions.clone() == simple_assumptions
+
+
+class TestDriverApis:
+    def test_cache_key_tracks_inputs(self, simple_assumptions):
+        c = simple_assumptions.clone()
+        assert hash(c.cache_key()) == hash(simple_assumptions.cache_key())
+        c.ebitda_margin[2026] += 0.01
+        assert c.cache_key() != simple_assumptions.cache_key()
+
+    def test_set_drivers_round_trips(self, simple_assumptions):
+        c = simple_assumptions.clone()
+        c.revenue_growth, c.tax_rate = {}, {}
+        c.set_drivers(simple_assumptions.driver_arrays())
+        assert c.cache_key() == simple_assumptions.cache_key()
 
 
 class TestSensitivity:
@@ -192,6 +231,37 @@ class TestSensitivity:
         col = result.columns[2]  # middle growth column
         assert result.iloc[0, 2] > result.iloc[-1, 2]
 
+    def test_base_cell_matches_run_dcf(self, simple_std, simple_assumptions):
+        result = run_sensitivity(simple_std, simple_assumptions, magnitude="millions")
+        base = run_dcf(simple_std, simple_assumptions, magnitude="millions")
+        # Middle row / column is the base WACC and growth rate
+        assert result.iloc[3, 2] == pytest.approx(base.price_per_share)
+
+    def test_every_cell_matches_run_dcf(self, simple_std, simple_assumptions):
+        result = run_sensitivity(simple_std, simple_assumptions, magnitude="millions")
+        for w in result.index:
+            for g in result.columns:
+                a = simple_assumptions.clone()
+                a.wacc, a.terminal_growth_rate = w, g
+                cell = run_dcf(simple_std, a, magnitude="millions")
+                assert result.loc[w, g] == pytest.approx(cell.price_per_share)
+
+    def test_growth_above_wacc_gives_zero_tv(self, simple_std, simple_assumptions):
+        result = run_sensitivity(
+            simple_std, simple_assumptions,
+            wacc_range=[0.05], growth_range=[0.06], magnitude="millions",
+        )
+        simple_assumptions.wacc = 0.05
+        simple_assumptions.terminal_growth_rate = 0.06
+        base = run_dcf(simple_std, simple_assumptions, magnitude="millions")
+        assert base.terminal_value == 0.0
+        assert result.iloc[0, 0] == pytest.approx(base.price_per_share)
+
+    def test_zero_shares_gives_zero_grid(self, simple_std, simple_assumptions):
+        simple_assumptions.diluted_shares = 0.0
+        grid = run_sensitivity(simple_std, simple_assumptions, magnitude="millions")
+        assert (grid.values == 0.0).all()
+
 
 class TestTornado:
     def test_tornado_count(self, simple_std, simple_assumptions):
@@ -203,6 +273,32 @@ class TestTornado:
         spreads = [abs(d["high"] - d["low"]) for d in result]
         assert spreads == sorted(spreads, reverse=True)
 
+    def test_tornado_matches_run_dcf(self, simple_std, simple_assumptions):
+        result = run_tornado(simple_std, simple_assumptions, magnitude="millions")
+        by_var = {d["variable"]: d for d in result}
+        base = run_dcf(simple_std, simple_assumptions, magnitude="millions")
+        assert by_var["wacc"]["base"] == pytest.approx(base.price_per_share)
+
+        shocked = simple_assumptions.clone()
+        shocked.ebitda_margin = {y: v + 0.02 for y, v in shocked.ebitda_margin.items()}
+        high = run_dcf(simple_std, shocked, magnitude="millions")
+        assert by_var["ebitda_margin"]["high"] == pytest.approx(high.price_per_share)
+
+        shocked = simple_assumptions.clone()
+        shocked.wacc -= 0.01
+        low = run_dcf(simple_std, shocked, magnitude="millions")
+        assert by_var["wacc"]["low"] == pytest.approx(low.price_per_share)
+
+    def test_tornado_leaves_assumptions_untouched(self, simple_std, simple_assumptions):
+        before = simple_assumptions.clone()
+        run_tornado(simple_std, simple_assumptions, magnitude="millions")
+        assert simple_assumptions == before
+
+    def test_zero_shares_gives_zero_prices(self, simple_std, simple_assumptions):
+        simple_assumptions.diluted_shares = 0.0
+        result = run_tornado(simple_std, simple_assumptions, magnitude="millions")
+        assert all(d["low"] == d["high"] == d["base"] == 0.0 for d in result)
+
 
 class TestBuildDefaultAssumptions:
     def test_from_standardized(self, standardized_data):
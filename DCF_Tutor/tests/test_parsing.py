@@ -2,47 +2,66 @@
 
 from __future__ import annotations
 
+import dataclasses
+import math
+
+import numpy as np
 import pytest
 
-from src.utils import clean_number, normalize_label, extract_year, detect_estimate, fuzzy_match
+from src.utils import (
+    clean_number,
+    clean_number_array,
+    clean_number_column,
+    normalize_label,
+    extract_year,
+    detect_estimate,
+    parse_year_header,
+    fuzzy_match,
+    fuzzy_score_matrix,
+    fmt_number,
+    fmt_number_array,
+    _indel_ratio_matrix,
+    _pack_token_sorted,
+)
+from src.importer import _classify_sheet
+from src.mapping import _map_fields
 
 
 class TestCleanNumber:
-    def test_integer(self):
-        assert clean_number(1234) == 1234.0
-
-    def test_float(self):
-        assert clean_number(12.34) == 12.34
-
-    def test_string_with_commas(self):
-        assert clean_number("1,234,567") == 1234567.0
-
-    def test_negative_parens(self):
-        assert clean_number("(500)") == -500.0
-
-    def test_negative_parens_with_dollar(self):
-        assert clean_number("($1,200)") == -1200.0
-
-    def test_na_string(self):
-        assert clean_number("NA") is None
-
-    def test_nm_string(self):
-        assert clean_number("NM") is None
-
-    def test_dash(self):
-        assert clean_number("--") is None
-
-    def test_empty_string(self):
-        assert clean_number("") is None
-
-    def test_none(self):
-        assert clean_number(None) is None
-
-    def test_percentage(self):
-        assert clean_number("89.5%") == 89.5
-
-    def test_currency_symbol(self):
-        assert clean_number("$1,000") == 1000.0
+    @pytest.mark.parametrize("value, expected", [
+        pytest.param(1234, 1234.0, id="integer"),
+        pytest.param(12.34, 12.34, id="float"),
+        pytest.param("1,234,567", 1234567.0, id="string_with_commas"),
+        pytest.param("(500)", -500.0, id="negative_parens"),
+        pytest.param("($1,200)", -1200.0, id="negative_parens_with_dollar"),
+        pytest.param("NA", None, id="na_string"),
+        pytest.param("NM", None, id="nm_string"),
+        pytest.param("--", None, id="dash"),
+        pytest.param("", None, id="empty_string"),
+        pytest.param(None, None, id="none"),
+        pytest.param("89.5%", 89.5, id="percentage"),
+        pytest.param("$1,000", 1000.0, id="currency_symbol"),
+    ])
+    def test_clean_number(self, value, expected):
+        result = clean_number(value)
+        if expected is None:
+            assert result is None
+        else:
+            assert result == expected
+
+    def test_array_matches_scalar(self):
+        values = [1234, 12.34, "1,234,567", "(500)", "($1,200)", "NA", "NM", "--", "", None,
+                  "89.5%", "$1,000", " '42' ", float("nan"), float("inf"), "abc", "(12%)"]
+        expected = [clean_number(v) for v in values]
+        got = clean_number_array(values).tolist()
+        for e, g in zip(expected, got):
+            assert (e is None and math.isnan(g)) or e == g
+
+    def test_column_text_and_numeric_paths(self):
+        text = clean_number_column(np.array(["(500)", "NM", 3], dtype=object))
+        assert text[0] == -500.0 and np.isnan(text[1]) and text[2] == 3.0
+        numeric = clean_number_column(np.array([1.0, float("inf"), 2.0]))
+        assert np.isnan(numeric).tolist() == [False, True, False]
 
 
 class TestNormalizeLabel:
@@ -80,6 +99,10 @@ class TestDetectEstimate:
     def test_estimate_word(self):
         assert detect_estimate("2025 Estimate") is True
 
+    def test_parse_year_header_combines_both(self):
+        for header in ["2025E FY", "2023 FY", "Revenue", "Proj. 2026", 2024]:
+            assert parse_year_header(header) == (extract_year(header), extract_year(header) is not None and detect_estimate(header))
+
 
 class TestFuzzyMatch:
     def test_exact(self):
@@ -97,6 +120,39 @@ class TestFuzzyMatch:
         assert match == ""
         assert score == 0.0
 
+    def test_score_matrix_matches_scalar(self):
+        queries = ["total revenue", "net income"]
+        candidates = ["Revenue", "Total Revenue", "Net Income (Loss)"]
+        scores = fuzzy_score_matrix(queries, [normalize_label(c) for c in candidates])
+        assert scores.shape == (2, 3)
+        for q, row in zip(queries, scores):
+            match, score = fuzzy_match(q, candidates, threshold=0.0)
+            assert candidates[row.argmax()] == match
+            assert row.max() == pytest.approx(score)
+
+    def test_exact_normalized_hit_wins_over_permutation(self):
+        # "revenue total" also scores 100 under token sorting; the verbatim label wins
+        candidates = ["Revenue Total", "Total Revenue"]
+        assert fuzzy_match("total revenue", candidates) == ("Total Revenue", 1.0)
+
+    def test_numba_fallback_matches_rapidfuzz(self):
+        rapidfuzz = pytest.importorskip("rapidfuzz")
+        if _indel_ratio_matrix is None:
+            pytest.skip("numba not installed")
+        queries = ["revenue total", "net income", "", "d a"]
+        candidates = ["total revenue", "net income loss", "", "da", "ebitda"]
+        packed = _pack_token_sorted(queries) + _pack_token_sorted(candidates) + (0.0,)
+        expected = rapidfuzz.process.cdist(queries, candidates, scorer=rapidfuzz.fuzz.token_sort_ratio)
+        assert _indel_ratio_matrix(*packed) == pytest.approx(expected)
+
+
+class TestFmtNumberArray:
+    def test_matches_scalar_formatter(self):
+        values = [[1234.567, -0.5], [float("nan"), -0.0]]
+        text = fmt_number_array(values, 2, "$", "M")
+        assert text.shape == (2, 2)
+        assert text.ravel().tolist() == [fmt_number(v, 2, "$", "M") for row in values for v in row]
+
 
 class TestImporter:
     def test_parse_sheets(self, parsed_workbook):
@@ -127,6 +183,10 @@ class TestImporter:
                 assert sheet.statement_df is not None
                 assert not sheet.statement_df.empty
                 assert "Revenue" in sheet.statement_df.index
+                assert "nan" not in sheet.statement_df.index
+
+    def test_first_sheet(self, parsed_workbook):
+        assert parsed_workbook.first_sheet is parsed_workbook.sheets["Income Statement"]
 
     def test_magnitude_detected(self, parsed_workbook):
         wb = parsed_workbook
@@ -134,12 +194,27 @@ class TestImporter:
             if sheet.sheet_type == "income":
                 assert sheet.magnitude == "thousands"
 
+    def test_metadata_detected(self, parsed_workbook):
+        first = parsed_workbook.first_sheet
+        assert first.company_name == "Acme Corp"
+        assert first.currency == "USD"
+
+    def test_classify_sheet_names(self):
+        assert _classify_sheet("  P&L (Annual) ") == "income"
+        assert _classify_sheet("Cash Flows") == "cashflow"
+        assert _classify_sheet("Capital Structure Detail") == "capstruct_detail"
+        assert _classify_sheet("Key Stats") == "unknown"
+
 
 class TestMapping:
     def test_standardized_created(self, standardized_data):
         std, report, exit_mult = standardized_data
         assert not std.income_statement.empty
 
+    def test_years_sorted(self, standardized_data):
+        std, _, _ = standardized_data
+        assert std.years == tuple(range(2019, 2025))
+
     def test_revenue_mapped(self, standardized_data):
         std, report, _ = standardized_data
         assert "Revenue" in std.income_statement.index
@@ -155,3 +230,12 @@ class TestMapping:
         # May or may not be extracted depending on matching
         # Just verify it doesn't crash
         assert exit_mult is None or isinstance(exit_mult, float)
+
+    def test_cached_mapping_entries_are_immutable(self):
+        labels = ["Total Revenue", "EBITDA", "Net Income"]
+        first = _map_fields("income", labels)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first[0].user_override = "Net Income"
+        overridden = dataclasses.replace(first[0], user_override="Net Income")
+        assert overridden.resolved == "Net Income"
+        assert _map_fields("income", labels)[0] is first[0]  # cached entries are shared, not copied